@@ -1,11 +1,14 @@
 # basic import
-from mcp.server.fastmcp import FastMCP, Context
-import math
-import requests
-import datetime
-from typing import Dict, List, Any, Optional
+from mcp.server.fastmcp import FastMCP
+import asyncio
+import atexit
+import os
+from typing import List, Optional
 import logging
-import sys
+import logging.handlers
+import queue
+import threading
+import time
 
 # Import our organized Salesforce tools
 from tools import (
@@ -18,15 +21,40 @@ from tools import (
     query_records,
     get_validation_rules,
     manage_debug_logs,
+    fetch_describes_batch,
+    describe_objects_batch,
+    clear_describes,
+)
+from sf_connection import (
+    get_connection,
+    get_connection_info,
+    get_global_describe,
+    clear_global_describe,
+    format_error,
+    validate_api_name,
 )
-from sf_connection import get_connection
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("sf_mcp_server.log"), logging.StreamHandler()],
+# Records are handed to a queue and written by a background listener, so
+# file and stream I/O never block the thread serving a tool call.
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+_log_handlers = [logging.FileHandler("sf_mcp_server.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue handler only merges the message arguments; the listener's
+# handlers apply the full format
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger("sf_mcp_server")
 
 # =================================================================
@@ -50,7 +78,9 @@ mcp = FastMCP(
 
 
 @mcp.tool()
-def search_salesforce_objects(pattern: str, sandbox: bool = True) -> str:
+async def search_salesforce_objects(
+    pattern: str, sandbox: bool = True, include_fields: bool = False
+) -> str:
     """
     Search for Salesforce standard and custom objects by name pattern.
 
@@ -65,22 +95,23 @@ def search_salesforce_objects(pattern: str, sandbox: bool = True) -> str:
 
     Args:
         pattern: The search pattern to match object names (e.g., 'Account', 'Order')
-        sandbox: Whether to connect to sandbox (True) or production (False)
+        include_fields: Whether to also list the field API names of the first 20 matches
+        include_fields: Whether to also list the field API names of each match
 
     Returns:
         A formatted list of matching Salesforce objects
     """
     try:
-        logger.info(f"Searching for Salesforce objects with pattern: {pattern}")
-        result = search_objects(pattern)
+        logger.info("Searching for Salesforce objects with pattern: %s", pattern)
+        result = await asyncio.to_thread(search_objects, pattern, include_fields)
         return result
     except Exception as e:
-        logger.error(f"Error searching Salesforce objects: {str(e)}")
-        return f"Error searching Salesforce objects: {str(e)}"
+        logger.error("Error searching Salesforce objects: %s", e)
+        return format_error(e, "searching Salesforce objects")
 
 
 @mcp.tool()
-def describe_salesforce_object(object_name: str) -> str:
+async def describe_salesforce_object(object_name: str) -> str:
     """
     Get detailed schema metadata including all fields, relationships, and field properties of any Salesforce object.
 
@@ -105,18 +136,61 @@ def describe_salesforce_object(object_name: str) -> str:
         Detailed schema information for the object
     """
     try:
-        logger.info(f"Describing Salesforce object: {object_name}")
-        return describe_object(object_name)
+        error = validate_api_name(object_name)
+        if error:
+            return error
+
+        logger.info("Describing Salesforce object: %s", object_name)
+        return await asyncio.to_thread(describe_object, object_name)
     except Exception as e:
-        logger.error(f"Error describing object {object_name}: {str(e)}")
-        return f"Error describing object {object_name}: {str(e)}"
+        logger.error("Error describing object %s: %s", object_name, e)
+        return format_error(e, f"describing object {object_name}")
 
 
 @mcp.tool()
-def describe_salesforce_object_raw_json(object_name: str) -> str:
+async def describe_salesforce_objects_batch(object_names: List[str]) -> str:
+    """
+    Get detailed schema metadata for several Salesforce objects in one request.
+
+    Use this instead of calling describe_salesforce_object repeatedly when you
+    need to understand multiple objects. Up to 25 objects are described per
+    Salesforce round trip, and the results are cached so later single-object
+    describes for the same objects return instantly.
+
+    Examples:
+    - "Describe Account, Contact and Opportunity"
+    - "What fields are on Case, CaseComment and Solution?"
+    - "Show me the schema for all the order management objects"
+
+    Args:
+        object_names: API names of the objects (e.g., ['Account', 'Contact', 'Custom_Object__c'])
+
+    Returns:
+        Detailed schema information for each object
+    """
+    try:
+        if not object_names:
+            return "Error: At least one object name must be specified"
+        for object_name in object_names:
+            error = validate_api_name(object_name)
+            if error:
+                return error
+
+        return await asyncio.to_thread(describe_objects_batch, object_names)
+    except Exception as e:
+        logger.error("Error batch describing objects: %s", e)
+        return format_error(e, f"batch describing objects {object_names}")
+
+
+@mcp.tool()
+async def describe_salesforce_object_raw_json(
+    object_name: str, max_fields: int = 500
+) -> str:
     """
     Get the complete Salesforce object schema as raw JSON.
     This returns the unfiltered API response directly from Salesforce.
+    Objects with more than max_fields fields are truncated to the first
+    max_fields fields and marked with "_truncated" and "_total_fields".
 
     This tool is useful when you need the complete, detailed metadata for advanced
     analysis or when you need to access specific metadata properties not included
@@ -131,20 +205,27 @@ def describe_salesforce_object_raw_json(object_name: str) -> str:
 
     Args:
         object_name: API name of the object (e.g., 'Account', 'Contact', 'Custom_Object__c')
+        max_fields: Maximum number of fields to include; 0 for no limit (default: 500)
 
     Returns:
         Complete raw JSON schema from Salesforce API
     """
     try:
-        logger.info(f"Getting raw JSON schema for object: {object_name}")
-        return describe_object_with_api(object_name, raw_json=True)
+        error = validate_api_name(object_name)
+        if error:
+            return error
+
+        logger.info("Getting raw JSON schema for object: %s", object_name)
+        return await asyncio.to_thread(
+            describe_object_with_api, object_name, raw_json=True, max_fields=max_fields
+        )
     except Exception as e:
-        logger.error(f"Error retrieving raw JSON for {object_name}: {str(e)}")
-        return f"Error retrieving raw JSON for {object_name}: {str(e)}"
+        logger.error("Error retrieving raw JSON for %s: %s", object_name, e)
+        return format_error(e, f"retrieving raw JSON for {object_name}")
 
 
 @mcp.tool()
-def get_salesforce_picklist_values(object_name: str, field_name: str) -> str:
+async def get_salesforce_picklist_values(object_name: str, field_name: str) -> str:
     """
     Get all values from a picklist field.
 
@@ -171,15 +252,21 @@ def get_salesforce_picklist_values(object_name: str, field_name: str) -> str:
         List of picklist values with their properties
     """
     try:
-        logger.info(f"Getting picklist values for {object_name}.{field_name}")
-        return get_picklist_values(object_name, field_name)
+        error = validate_api_name(object_name) or validate_api_name(field_name, "field")
+        if error:
+            return error
+
+        logger.info("Getting picklist values for %s.%s", object_name, field_name)
+        return await asyncio.to_thread(get_picklist_values, object_name, field_name)
     except Exception as e:
-        logger.error(f"Error getting picklist values: {str(e)}")
-        return f"Error getting picklist values for {object_name}.{field_name}: {str(e)}"
+        logger.error("Error getting picklist values: %s", e)
+        return format_error(
+            e, f"getting picklist values for {object_name}.{field_name}"
+        )
 
 
 @mcp.tool()
-def describe_salesforce_relationship_fields(object_name: str) -> str:
+async def describe_salesforce_relationship_fields(object_name: str) -> str:
     """
     Show all relationship fields (lookups, master-detail) for a Salesforce object.
 
@@ -207,15 +294,21 @@ def describe_salesforce_relationship_fields(object_name: str) -> str:
         Detailed information about relationship fields
     """
     try:
-        logger.info(f"Describing relationship fields for: {object_name}")
-        return describe_relationship_fields(object_name)
+        error = validate_api_name(object_name)
+        if error:
+            return error
+
+        logger.info("Describing relationship fields for: %s", object_name)
+        return await asyncio.to_thread(describe_relationship_fields, object_name)
     except Exception as e:
-        logger.error(f"Error describing relationship fields: {str(e)}")
-        return f"Error describing relationship fields for {object_name}: {str(e)}"
+        logger.error("Error describing relationship fields: %s", e)
+        return format_error(e, f"describing relationship fields for {object_name}")
 
 
 @mcp.tool()
-def get_salesforce_fields_by_type(object_name: str, field_type: str = None) -> str:
+async def get_salesforce_fields_by_type(
+    object_name: str, field_type: str = None
+) -> str:
     """
     Get fields of a specific type for a Salesforce object.
     If no type is specified, returns all fields.
@@ -247,13 +340,56 @@ def get_salesforce_fields_by_type(object_name: str, field_type: str = None) -> s
         Table of fields with their properties
     """
     try:
-        logger.info(
-            f"Getting fields for {object_name}, type filter: {field_type or 'None'}"
-        )
-        return get_fields_by_type(object_name, field_type)
+        error = validate_api_name(object_name)
+        if error:
+            return error
+
+        logger.info("Getting fields for %s, type filter: %s", object_name, field_type)
+        return await asyncio.to_thread(get_fields_by_type, object_name, field_type)
     except Exception as e:
-        logger.error(f"Error getting fields by type: {str(e)}")
-        return f"Error getting fields for {object_name}: {str(e)}"
+        logger.error("Error getting fields by type: %s", e)
+        return format_error(e, f"getting fields for {object_name}")
+
+
+@mcp.tool()
+async def clear_describe_cache(object_name: Optional[str] = None) -> str:
+    """
+    Clear cached Salesforce describe results.
+
+    Describe results are cached for a few minutes so repeated questions about
+    the same object are answered instantly. Use this tool after changing an
+    object's schema in Salesforce (new fields, picklist values, etc.) to make
+    sure the next describe reflects the change.
+
+    Examples:
+    - "Clear the describe cache"
+    - "I just added a field to Account, refresh its schema"
+
+    Args:
+        object_name: Optional API name of a single object to clear. If omitted,
+                     the whole cache is cleared.
+
+    Returns:
+        Confirmation of how many cached entries were removed
+    """
+    try:
+        # Clearing removes files on disk and may authenticate, so it runs
+        # off the event loop
+        removed = await asyncio.to_thread(_clear_describe_caches, object_name)
+        logger.info("Cleared %d describe cache entries", removed)
+        return f"Cleared {removed} cached describe result(s)."
+    except Exception as e:
+        logger.error("Error clearing describe cache: %s", e)
+        return format_error(e, "clearing the describe cache")
+
+
+def _clear_describe_caches(object_name: Optional[str]) -> int:
+    """Clear cached describes, and the global describe when clearing all."""
+    removed = clear_describes(object_name)
+    if not object_name:
+        # The object list may have changed too
+        clear_global_describe()
+    return removed
 
 
 # =================================================================
@@ -265,7 +401,7 @@ def get_salesforce_fields_by_type(object_name: str, field_type: str = None) -> s
 
 
 @mcp.tool()
-def query_salesforce_records(
+async def query_salesforce_records(
     object_name: str,
     fields: List[str],
     where_clause: Optional[str] = None,
@@ -316,11 +452,15 @@ def query_salesforce_records(
             elif limit > 100:
                 limit = 100  # Cap at reasonable maximum
 
-        logger.info(f"Querying {object_name} records. Fields: {fields}, Limit: {limit}")
-        return query_records(object_name, fields, where_clause, order_by, limit)
+        logger.info(
+            "Querying %s records. Fields: %s, Limit: %s", object_name, fields, limit
+        )
+        return await asyncio.to_thread(
+            query_records, object_name, fields, where_clause, order_by, limit
+        )
     except Exception as e:
-        logger.error(f"Error querying records: {str(e)}")
-        return f"Error querying {object_name} records: {str(e)}"
+        logger.error("Error querying records: %s", e)
+        return format_error(e, f"querying {object_name} records")
 
 
 # =================================================================
@@ -333,7 +473,7 @@ def query_salesforce_records(
 
 
 @mcp.tool()
-def get_salesforce_validation_rules(object_name: str) -> str:
+async def get_salesforce_validation_rules(object_name: str) -> str:
     """
     Get validation rules for a specific Salesforce object.
 
@@ -361,18 +501,19 @@ def get_salesforce_validation_rules(object_name: str) -> str:
         List of validation rules with their details
     """
     try:
-        if not object_name or not object_name.strip():
-            return "Error: Object name is required"
+        error = validate_api_name(object_name)
+        if error:
+            return error
 
-        logger.info(f"Getting validation rules for: {object_name}")
-        return get_validation_rules(object_name)
+        logger.info("Getting validation rules for: %s", object_name)
+        return await asyncio.to_thread(get_validation_rules, object_name)
     except Exception as e:
-        logger.error(f"Error retrieving validation rules: {str(e)}")
-        return f"Error retrieving validation rules for {object_name}: {str(e)}"
+        logger.error("Error retrieving validation rules: %s", e)
+        return format_error(e, f"retrieving validation rules for {object_name}")
 
 
 @mcp.tool()
-def manage_salesforce_debug_logs(
+async def manage_salesforce_debug_logs(
     operation: str,
     username: str,
     log_level: Optional[str] = None,
@@ -418,8 +559,9 @@ def manage_salesforce_debug_logs(
         Formatted string with the result of the operation
     """
     try:
-        logger.info(f"Managing debug logs: {operation} for {username}")
-        return manage_debug_logs(
+        logger.info("Managing debug logs: %s for %s", operation, username)
+        return await asyncio.to_thread(
+            manage_debug_logs,
             operation=operation,
             username=username,
             log_level=log_level,
@@ -429,8 +571,8 @@ def manage_salesforce_debug_logs(
             include_body=include_body,
         )
     except Exception as e:
-        logger.error(f"Error managing debug logs: {str(e)}")
-        return f"Error managing debug logs: {str(e)}"
+        logger.error("Error managing debug logs: %s", e)
+        return format_error(e, "managing debug logs")
 
 
 # =================================================================
@@ -442,7 +584,7 @@ def manage_salesforce_debug_logs(
 
 
 @mcp.resource("salesforce://schema/{object_name}")
-def get_object_schema_resource(object_name: str) -> str:
+async def get_object_schema_resource(object_name: str) -> str:
     """
     Get schema for a Salesforce object
 
@@ -451,15 +593,21 @@ def get_object_schema_resource(object_name: str) -> str:
     the specified object.
     """
     try:
-        logger.info(f"Resource request: Schema for {object_name}")
-        return describe_object(object_name, include_field_details=True)
+        error = validate_api_name(object_name)
+        if error:
+            return error
+
+        logger.info("Resource request: Schema for %s", object_name)
+        return await asyncio.to_thread(
+            describe_object, object_name, include_field_details=True
+        )
     except Exception as e:
-        logger.error(f"Error serving schema resource: {str(e)}")
-        return f"Error retrieving schema for {object_name}: {str(e)}"
+        logger.error("Error serving schema resource: %s", e)
+        return format_error(e, f"retrieving schema for {object_name}")
 
 
 @mcp.resource("salesforce://picklist/{object_name}/{field_name}")
-def get_picklist_resource(object_name: str, field_name: str) -> str:
+async def get_picklist_resource(object_name: str, field_name: str) -> str:
     """
     Get picklist values for a specific field
 
@@ -468,12 +616,18 @@ def get_picklist_resource(object_name: str, field_name: str) -> str:
     for the specified object field.
     """
     try:
-        logger.info(f"Resource request: Picklist values for {object_name}.{field_name}")
-        return get_picklist_values(object_name, field_name)
+        error = validate_api_name(object_name) or validate_api_name(field_name, "field")
+        if error:
+            return error
+
+        logger.info(
+            "Resource request: Picklist values for %s.%s", object_name, field_name
+        )
+        return await asyncio.to_thread(get_picklist_values, object_name, field_name)
     except Exception as e:
-        logger.error(f"Error serving picklist resource: {str(e)}")
-        return (
-            f"Error retrieving picklist values for {object_name}.{field_name}: {str(e)}"
+        logger.error("Error serving picklist resource: %s", e)
+        return format_error(
+            e, f"retrieving picklist values for {object_name}.{field_name}"
         )
 
 
@@ -485,10 +639,9 @@ def get_picklist_resource(object_name: str, field_name: str) -> str:
 # =================================================================
 
 
-@mcp.prompt()
-def search_objects_prompt() -> str:
-    """Create a prompt for searching Salesforce objects"""
-    return """
+# Prompt texts are module-level constants; each prompt returns its constant
+
+_SEARCH_OBJECTS_PROMPT = """
     I'll help you search for Salesforce objects.
     
     You can ask for:
@@ -506,11 +659,7 @@ def search_objects_prompt() -> str:
     What objects are you looking for?
     """
 
-
-@mcp.prompt()
-def query_records_prompt() -> str:
-    """Create a prompt for querying Salesforce records"""
-    return """
+_QUERY_RECORDS_PROMPT = """
     I'll help you retrieve data from your Salesforce org.
     
     You can ask for:
@@ -528,11 +677,7 @@ def query_records_prompt() -> str:
     What kind of data would you like to see?
     """
 
-
-@mcp.prompt()
-def describe_object_prompt() -> str:
-    """Create a prompt for describing Salesforce objects"""
-    return """
+_DESCRIBE_OBJECT_PROMPT = """
     I'll help you explore and understand Salesforce objects.
     
     You can ask for:
@@ -553,11 +698,7 @@ def describe_object_prompt() -> str:
     Which Salesforce object would you like to explore?
     """
 
-
-@mcp.prompt()
-def picklist_values_prompt() -> str:
-    """Create a prompt for retrieving picklist values"""
-    return """
+_PICKLIST_VALUES_PROMPT = """
     I'll help you explore picklist values for any Salesforce field.
     
     Examples:
@@ -571,11 +712,7 @@ def picklist_values_prompt() -> str:
     Which object and field would you like to explore?
     """
 
-
-@mcp.prompt()
-def relationship_fields_prompt() -> str:
-    """Create a prompt for exploring relationship fields"""
-    return """
+_RELATIONSHIP_FIELDS_PROMPT = """
     I'll help you understand the relationships between Salesforce objects.
     
     Examples:
@@ -589,11 +726,7 @@ def relationship_fields_prompt() -> str:
     Which object's relationships would you like to explore?
     """
 
-
-@mcp.prompt()
-def validation_rules_prompt() -> str:
-    """Create a prompt for exploring validation rules"""
-    return """
+_VALIDATION_RULES_PROMPT = """
     I'll help you understand the validation rules applied to Salesforce objects.
     
     Examples:
@@ -607,11 +740,7 @@ def validation_rules_prompt() -> str:
     Which object's validation rules would you like to explore?
     """
 
-
-@mcp.prompt()
-def cross_object_search_prompt() -> str:
-    """Create a prompt for searching across multiple objects"""
-    return """
+_CROSS_OBJECT_SEARCH_PROMPT = """
     I'll help you search for content across multiple Salesforce objects.
     
     Examples:
@@ -625,11 +754,7 @@ def cross_object_search_prompt() -> str:
     What would you like to search for?
     """
 
-
-@mcp.prompt()
-def field_type_exploration_prompt() -> str:
-    """Create a prompt for exploring fields by their type"""
-    return """
+_FIELD_TYPE_EXPLORATION_PROMPT = """
     I'll help you find fields of specific types within Salesforce objects.
     
     Examples:
@@ -643,11 +768,7 @@ def field_type_exploration_prompt() -> str:
     Which type of fields would you like to explore?
     """
 
-
-@mcp.prompt()
-def debug_logs_prompt() -> str:
-    """Create a prompt for managing debug logs"""
-    return """
+_DEBUG_LOGS_PROMPT = """
     I'll help you manage debug logs for troubleshooting Salesforce issues.
     
     You can:
@@ -668,6 +789,60 @@ def debug_logs_prompt() -> str:
     """
 
 
+@mcp.prompt()
+def search_objects_prompt() -> str:
+    """Create a prompt for searching Salesforce objects"""
+    return _SEARCH_OBJECTS_PROMPT
+
+
+@mcp.prompt()
+def query_records_prompt() -> str:
+    """Create a prompt for querying Salesforce records"""
+    return _QUERY_RECORDS_PROMPT
+
+
+@mcp.prompt()
+def describe_object_prompt() -> str:
+    """Create a prompt for describing Salesforce objects"""
+    return _DESCRIBE_OBJECT_PROMPT
+
+
+@mcp.prompt()
+def picklist_values_prompt() -> str:
+    """Create a prompt for retrieving picklist values"""
+    return _PICKLIST_VALUES_PROMPT
+
+
+@mcp.prompt()
+def relationship_fields_prompt() -> str:
+    """Create a prompt for exploring relationship fields"""
+    return _RELATIONSHIP_FIELDS_PROMPT
+
+
+@mcp.prompt()
+def validation_rules_prompt() -> str:
+    """Create a prompt for exploring validation rules"""
+    return _VALIDATION_RULES_PROMPT
+
+
+@mcp.prompt()
+def cross_object_search_prompt() -> str:
+    """Create a prompt for searching across multiple objects"""
+    return _CROSS_OBJECT_SEARCH_PROMPT
+
+
+@mcp.prompt()
+def field_type_exploration_prompt() -> str:
+    """Create a prompt for exploring fields by their type"""
+    return _FIELD_TYPE_EXPLORATION_PROMPT
+
+
+@mcp.prompt()
+def debug_logs_prompt() -> str:
+    """Create a prompt for managing debug logs"""
+    return _DEBUG_LOGS_PROMPT
+
+
 # =================================================================
 # CONNECTION HEALTH CHECK
 # =================================================================
@@ -677,7 +852,7 @@ def debug_logs_prompt() -> str:
 
 
 @mcp.tool()
-def check_salesforce_connection() -> str:
+async def check_salesforce_connection() -> str:
     """
     Check the connection to Salesforce and return basic org information.
 
@@ -702,26 +877,27 @@ def check_salesforce_connection() -> str:
     """
     try:
         logger.info("Checking Salesforce connection status")
-        sf = get_connection()
-
-        # Use the get_connection_info function to get connection details
-        from sf_connection import get_connection_info
-
-        # Get connection information
-        connection_info = get_connection_info()
+        await asyncio.to_thread(get_connection)
+
+        # Fetch connection information and test the connection with a simple
+        # request concurrently; global describe should work with any permissions
+        connection_info, describe_global = await asyncio.gather(
+            asyncio.to_thread(get_connection_info),
+            asyncio.to_thread(get_global_describe),
+            return_exceptions=True,
+        )
+        if isinstance(connection_info, Exception):
+            raise connection_info
 
-        # Test connection by attempting a simple request
-        try:
-            # Simply fetch global describe which should work with any permissions
-            describe_global = sf.describe()
+        if isinstance(describe_global, Exception):
+            connection_status = f"Partially working (API connection active but describe failed: {str(describe_global)})"
+        else:
             total_objects = (
                 len(describe_global["sobjects"])
                 if describe_global and "sobjects" in describe_global
                 else 0
             )
             connection_status = f"Successful ({total_objects} objects available)"
-        except Exception as e:
-            connection_status = f"Partially working (API connection active but describe failed: {str(e)})"
 
         return f"""
         Salesforce connection is active.
@@ -733,8 +909,46 @@ def check_salesforce_connection() -> str:
         """
 
     except Exception as e:
-        logger.error(f"Connection check failed: {str(e)}")
-        return f"Error connecting to Salesforce: {str(e)}"
+        logger.error("Connection check failed: %s", e)
+        return format_error(e, "connecting to Salesforce")
+
+
+# =================================================================
+# CACHE WARMING
+# =================================================================
+# The first tool call after startup would otherwise pay for
+# authentication, the global describe and a describe round trip. A
+# background thread fetches these while the client is still connecting.
+# Set SALESFORCE_WARM_OBJECTS to a comma-separated list of objects to
+# prefetch, or to an empty string to disable warming.
+# =================================================================
+
+_WARM_OBJECTS = [
+    name.strip()
+    for name in os.environ.get(
+        "SALESFORCE_WARM_OBJECTS", "Account,Contact,Lead,Opportunity,Case"
+    ).split(",")
+    if name.strip()
+]
+
+
+def _warm_caches() -> None:
+    """Authenticate and prefetch the global describe and common object describes."""
+    if not _WARM_OBJECTS:
+        return
+    try:
+        start = time.perf_counter()
+        get_connection()
+        get_global_describe()
+        describes, errors = fetch_describes_batch(_WARM_OBJECTS)
+        logger.info(
+            "Warmed caches with %d describes (%d errors) in %.2fs",
+            len(describes),
+            len(errors),
+            time.perf_counter() - start,
+        )
+    except Exception as e:
+        logger.warning("Cache warming failed: %s", e)
 
 
 # =================================================================
@@ -745,8 +959,9 @@ def check_salesforce_connection() -> str:
 if __name__ == "__main__":
     try:
         logger.info("Starting Salesforce MCP Server")
+        threading.Thread(target=_warm_caches, name="cache-warmer", daemon=True).start()
         # Explicitly set transport to stdio to avoid SSE connection issues
         mcp.run()
     except Exception as e:
-        logger.critical(f"Failed to start MCP server: {str(e)}")
+        logger.critical("Failed to start MCP server: %s", e)
         raise
@@ -3,10 +3,153 @@
 Salesforce connection utility module for MCP tools
 Handles authentication and connection management
 """
+
+import gzip
+import json
+import logging
 import os
+import random
+import re
+import threading
+import time
 import requests
-from typing import Tuple, Dict, Any, Optional
-from simple_salesforce import Salesforce
+from dataclasses import dataclass
+from email.utils import formatdate
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Tuple, Dict, Any, List, Optional
+from urllib3.util.retry import Retry
+
+# simple_salesforce (and zeep, which it pulls in) takes a few hundred ms to
+# import, so it is imported on first use rather than at server startup.
+if TYPE_CHECKING:
+    from simple_salesforce import Salesforce
+
+logger = logging.getLogger("sf_mcp_server.connection")
+
+# orjson decodes large describe payloads several times faster than the
+# stdlib json module; it is optional and json is used when it's missing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# (connect, read) timeout in seconds applied to every Salesforce request, so
+# a slow or unresponsive peer can't pin a worker thread indefinitely. The read
+# timeout can be raised with SALESFORCE_REQUEST_TIMEOUT for slow queries.
+REQUEST_TIMEOUT = (3.05, float(os.environ.get("SALESFORCE_REQUEST_TIMEOUT", "30")))
+
+
+class _TimeoutSession(requests.Session):
+    """requests.Session that applies REQUEST_TIMEOUT unless a timeout is given."""
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+# Transient statuses retried by the shared session, and the maximum random
+# delay added to each backoff
+_RETRY_STATUSES = [429, 500, 502, 503, 504]
+_BACKOFF_JITTER = 0.5
+
+
+class _JitteredRetry(Retry):
+    """Retry that adds up to _BACKOFF_JITTER seconds of jitter to each backoff.
+
+    Spreading the retries out keeps concurrent tool calls that failed together
+    from hitting Salesforce again at the same instant. A Retry-After header on
+    a 429/503 still takes precedence over the backoff.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, _BACKOFF_JITTER) if backoff else backoff
+
+
+# Shared HTTP session for all Salesforce traffic (auth and API calls).
+# Pooling keeps connections alive between tool calls so each request
+# skips the DNS + TCP + TLS handshake, and transient 429/5xx responses
+# are retried with backoff. simple_salesforce is given this session too,
+# so the timeout also covers its queries.
+_SESSION = _TimeoutSession()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=_JitteredRetry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+        ),
+    ),
+)
+
+# The token endpoint is called through its own session, built once, whose
+# adapter also retries the client credentials POST. Other POSTs are left to
+# the caller, as they are not all safe to repeat. Keeping it separate means
+# the shared session's adapters are never remounted while other threads use it.
+_AUTH_SESSION = _TimeoutSession()
+_AUTH_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=_JitteredRetry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+        ),
+    ),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class SObjectSummary:
+    """An sObject in the global describe, as listed by search_objects."""
+
+    name: str
+    label: str
+    custom: bool
+
+
+# Cached global describe (the list of all sObjects in the org). The payload
+# can be several MB for large orgs and rarely changes within a session.
+# "index" holds (lowercase name, lowercase label, SObjectSummary) tuples built once
+# per fetch so searches don't re-lowercase every name on each call.
+# "generation" is bumped by clear_global_describe so a background refresh that
+# was already running doesn't put the dropped copy back.
+_GLOBAL_DESCRIBE_CACHE: Dict[str, Any] = {
+    "ts": 0.0,
+    "data": None,
+    "fetched_at": None,
+    "index": [],
+    "refreshing": False,
+    "generation": 0,
+}
+_GLOBAL_DESCRIBE_LOCK = threading.Lock()
+
+# Seconds past its ttl that a cached global describe is still returned while
+# it is revalidated in the background; older copies are revalidated inline
+GLOBAL_DESCRIBE_STALE = 1800
+
+# Root of the on-disk describe cache, shared with tools._describe_cache. The
+# global describe is saved as <instance>/sobjects.json.gz so a restarted
+# server (each MCP client session starts its own) does not re-fetch it. An
+# empty SALESFORCE_DESCRIBE_CACHE_DIR disables persistence.
+DESCRIBE_CACHE_DIR = os.path.expanduser(
+    os.environ.get("SALESFORCE_DESCRIBE_CACHE_DIR", "~/.cache/sf-mcp/describe")
+)
+
+# Access tokens are refreshed this long before they expire. Salesforce does
+# not return expires_in for client credentials tokens, so SALESFORCE_TOKEN_TTL
+# (default 55 minutes, under the shortest common session timeout) is assumed.
+TOKEN_TTL = float(os.environ.get("SALESFORCE_TOKEN_TTL", "3300"))
+_TOKEN_REFRESH_MARGIN = 60
+
+# (client_id, domain_url) -> {"instance": Salesforce, "expires": monotonic
+# expiry of the access token, "info": connection info}
+_CONNECTIONS: Dict[tuple, Dict[str, Any]] = {}
+_CONNECTION_LOCK = threading.Lock()
 
 
 def authenticate(
@@ -29,6 +172,14 @@ def authenticate(
     Returns:
         Tuple of (access_token, instance_url)
     """
+    body = _request_token(client_id, client_secret, domain_url)
+    return body.get("access_token"), body.get("instance_url")
+
+
+def _request_token(
+    client_id: str, client_secret: str, domain_url: str
+) -> Dict[str, Any]:
+    """Request a client credentials token and return the decoded token response."""
     if not domain_url:
         raise ValueError("SALESFORCE_DOMAIN_URL must be provided.")
     auth_url = f"{domain_url.rstrip('/')}/services/oauth2/token"
@@ -37,19 +188,35 @@ def authenticate(
         "client_id": client_id,
         "client_secret": client_secret,
     }
-    response = requests.post(auth_url, data=payload)
+    response = _AUTH_SESSION.post(auth_url, data=payload)
     response.raise_for_status()
-    access_token = response.json().get("access_token")
-    instance_url = response.json().get("instance_url")
-    print(f"[SUCCESS] Authenticated using client_credentials.")
-    return access_token, instance_url
+    logger.info("Authenticated using client_credentials")
+    return response.json()
+
+
+def _token_ttl(body: Dict[str, Any]) -> float:
+    """
+    Return how many seconds a token response is valid for.
+
+    Uses expires_in when Salesforce includes it; client credentials tokens
+    usually omit it, in which case SALESFORCE_TOKEN_TTL (default 55 minutes)
+    applies.
+    """
+    try:
+        return float(body["expires_in"])
+    except (KeyError, TypeError, ValueError):
+        return TOKEN_TTL
 
 
-def get_connection(cached: bool = True) -> Salesforce:
+def get_connection(cached: bool = True) -> "Salesforce":
     """
     Get a connection to Salesforce using credentials from environment
     or cached values if they exist and cached=True
 
+    Cached connections are re-authenticated shortly before their access token
+    expires. Re-authentication is single-flight: concurrent callers wait for
+    one token request and reuse its result.
+
     Args:
         cached: Whether to use cached credentials if available
 
@@ -61,30 +228,538 @@ def get_connection(cached: bool = True) -> Salesforce:
         "client_secret": os.environ.get("SALESFORCE_CLIENT_SECRET"),
         "domain_url": os.environ.get("SALESFORCE_DOMAIN_URL"),
     }
+    key = (creds["client_id"], creds["domain_url"])
+
+    # Fast path without the lock; dict reads are atomic and entries are
+    # replaced, never mutated
+    entry = _CONNECTIONS.get(key)
+    if cached and _is_fresh(entry):
+        return entry["instance"]
+
+    with _CONNECTION_LOCK:
+        # Another thread may have re-authenticated while this one waited
+        entry = _CONNECTIONS.get(key)
+        if cached and _is_fresh(entry):
+            return entry["instance"]
 
-    if not hasattr(get_connection, "_instance") or not cached:
-        access_token, instance_url = authenticate(
-            creds["client_id"],
-            creds["client_secret"],
-            domain_url=creds["domain_url"],
+        from simple_salesforce import Salesforce
+
+        body = _request_token(
+            creds["client_id"], creds["client_secret"], creds["domain_url"]
         )
-        get_connection._instance = Salesforce(
+        instance_url = body.get("instance_url")
+        sf = Salesforce(
             instance_url=instance_url,
-            session_id=access_token,
+            session_id=body.get("access_token"),
+            session=_SESSION,
         )
-        get_connection._access_token = access_token
-        get_connection._instance_url = instance_url
-        get_connection._connection_info = {
-            "instance_url": instance_url,
+        # The headers are built once per connection and sent with every API
+        # call; pretty-printed JSON only adds whitespace to each response
+        sf.headers.pop("X-PrettyPrint", None)
+        _CONNECTIONS[key] = {
+            "instance": sf,
+            "expires": time.monotonic() + _token_ttl(body),
+            "info": {"instance_url": instance_url},
         }
-    return get_connection._instance
+        return _CONNECTIONS[key]["instance"]
+
+
+def _is_fresh(entry: Optional[Dict[str, Any]]) -> bool:
+    """Whether a cached connection's token is not about to expire."""
+    return (
+        entry is not None
+        and time.monotonic() < entry["expires"] - _TOKEN_REFRESH_MARGIN
+    )
 
 
 def get_connection_info() -> Dict[str, str]:
     """
     Get information about the current Salesforce connection.
     """
-    if hasattr(get_connection, "_connection_info"):
-        return get_connection._connection_info
-    get_connection()
-    return get_connection._connection_info
+    key = (
+        os.environ.get("SALESFORCE_CLIENT_ID"),
+        os.environ.get("SALESFORCE_DOMAIN_URL"),
+    )
+    with _CONNECTION_LOCK:
+        entry = _CONNECTIONS.get(key)
+    if entry is None:
+        get_connection()
+        entry = _CONNECTIONS[key]
+    return entry["info"]
+
+
+def get_global_describe(ttl: float = 3600) -> Dict[str, Any]:
+    """
+    Get the global describe (all sObjects in the org), cached for ttl seconds.
+
+    Once the cached copy is older than ttl it is revalidated with an
+    If-Modified-Since request, so an unchanged org answers with a cheap 304
+    instead of re-sending the full payload. For up to GLOBAL_DESCRIBE_STALE
+    seconds past ttl the cached copy is returned right away and revalidated
+    in a background thread.
+
+    Each fetch is also saved under DESCRIBE_CACHE_DIR, and a server with no
+    cached copy yet starts from that file, keeping its age.
+
+    Args:
+        ttl: Seconds a cached global describe is used without revalidation
+
+    Returns:
+        Global describe result with an "sobjects" list of name, label and
+        custom entries
+    """
+    with _GLOBAL_DESCRIBE_LOCK:
+        cached = _GLOBAL_DESCRIBE_CACHE["data"]
+        if cached is not None:
+            age = time.monotonic() - _GLOBAL_DESCRIBE_CACHE["ts"]
+            if age < ttl:
+                return cached
+            if age < ttl + GLOBAL_DESCRIBE_STALE:
+                if not _GLOBAL_DESCRIBE_CACHE["refreshing"]:
+                    _GLOBAL_DESCRIBE_CACHE["refreshing"] = True
+                    threading.Thread(
+                        target=_refresh_global_describe,
+                        args=(_GLOBAL_DESCRIBE_CACHE["generation"],),
+                        daemon=True,
+                    ).start()
+                return cached
+        elif _load_global_describe(ttl):
+            return _GLOBAL_DESCRIBE_CACHE["data"]
+
+        sf = get_connection()
+        data, fetched_at = _request_global_describe(
+            sf, _GLOBAL_DESCRIBE_CACHE["fetched_at"]
+        )
+        return _save_global_describe(sf, data, fetched_at)
+
+
+def clear_global_describe() -> None:
+    """Drop the cached global describe, so the next call fetches it again."""
+    with _GLOBAL_DESCRIBE_LOCK:
+        _GLOBAL_DESCRIBE_CACHE.update(ts=0.0, data=None, fetched_at=None, index=[])
+        _GLOBAL_DESCRIBE_CACHE["generation"] += 1
+        remove_cache_file(_global_describe_path(get_connection()))
+
+
+def _refresh_global_describe(generation: int) -> None:
+    """
+    Revalidate the cached global describe in the background.
+
+    The request is made without holding the lock; its result is only cached
+    if the cache wasn't cleared in the meantime.
+    """
+    try:
+        with _GLOBAL_DESCRIBE_LOCK:
+            since = _GLOBAL_DESCRIBE_CACHE["fetched_at"]
+        sf = get_connection()
+        data, fetched_at = _request_global_describe(sf, since)
+        with _GLOBAL_DESCRIBE_LOCK:
+            if _GLOBAL_DESCRIBE_CACHE["generation"] == generation:
+                _save_global_describe(sf, data, fetched_at)
+    except Exception as e:
+        logger.warning("Background global describe refresh failed: %s", e)
+    finally:
+        with _GLOBAL_DESCRIBE_LOCK:
+            _GLOBAL_DESCRIBE_CACHE["refreshing"] = False
+
+
+def _request_global_describe(
+    sf: "Salesforce", since: Optional[str]
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch the global describe, revalidating against a copy fetched at since.
+
+    Returns:
+        The slimmed result and its fetch time, or (None, None) if the copy
+        fetched at since is still current
+    """
+    headers = dict(sf.headers)
+    if since is not None:
+        headers["If-Modified-Since"] = since
+
+    response = sf.session.get(f"{sf.base_url}sobjects/", headers=headers)
+    if response.status_code == 304 and since is not None:
+        return None, None
+    response.raise_for_status()
+
+    # Keep only what is read from each sObject; the full entries (flags and
+    # URLs for every object) would stay in memory for the life of the cache
+    data = json_loads(response.content)
+    data["sobjects"] = [
+        {"name": obj["name"], "label": obj["label"], "custom": obj.get("custom", False)}
+        for obj in data["sobjects"]
+    ]
+    return data, formatdate(usegmt=True)
+
+
+def _save_global_describe(
+    sf: "Salesforce", data: Optional[Dict[str, Any]], fetched_at: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Cache a result of _request_global_describe; the caller holds the lock.
+
+    A None result marks the cached copy as revalidated.
+    """
+    if data is None:
+        _GLOBAL_DESCRIBE_CACHE["ts"] = time.monotonic()
+        touch_cache_file(_global_describe_path(sf))
+        return _GLOBAL_DESCRIBE_CACHE["data"]
+    _store_global_describe(data, fetched_at, time.monotonic())
+    write_cache_file(
+        _global_describe_path(sf), {"fetched_at": fetched_at, "data": data}
+    )
+    return data
+
+
+def _store_global_describe(data: Dict[str, Any], fetched_at: str, ts: float) -> None:
+    """Cache a slimmed global describe and build its search index."""
+    _GLOBAL_DESCRIBE_CACHE.update(
+        ts=ts,
+        data=data,
+        fetched_at=fetched_at,
+        index=[
+            (
+                obj["name"].lower(),
+                obj["label"].lower(),
+                SObjectSummary(obj["name"], obj["label"], obj["custom"]),
+            )
+            for obj in data["sobjects"]
+        ],
+    )
+
+
+def _global_describe_path(sf: "Salesforce") -> Optional[str]:
+    """Return the global describe cache file for an org, or None if disabled."""
+    if not DESCRIBE_CACHE_DIR:
+        return None
+    return os.path.join(DESCRIBE_CACHE_DIR, sf.sf_instance, "sobjects.json.gz")
+
+
+def _load_global_describe(ttl: float) -> bool:
+    """
+    Cache the global describe saved on disk, if there is one.
+
+    The file's age carries over, so a copy older than ttl is cached but then
+    revalidated with If-Modified-Since like an in-memory one.
+
+    Returns:
+        Whether a copy younger than ttl was loaded
+    """
+    path = _global_describe_path(get_connection())
+    mtime = cache_file_mtime(path)
+    if mtime is None:
+        return False
+    saved = read_cache_file(path)
+    if not isinstance(saved, dict) or "data" not in saved or "fetched_at" not in saved:
+        return False
+    age = max(time.time() - mtime, 0.0)
+    _store_global_describe(saved["data"], saved["fetched_at"], time.monotonic() - age)
+    logger.debug("Loaded global describe from %s (%.0fs old)", path, age)
+    return age < ttl
+
+
+def get_sobject_index(ttl: float = 3600) -> List[Tuple[str, str, "SObjectSummary"]]:
+    """
+    Get a search index over the cached global describe.
+
+    Args:
+        ttl: Seconds a cached global describe is used without revalidation
+
+    Returns:
+        List of (lowercase name, lowercase label, SObjectSummary) tuples
+    """
+    get_global_describe(ttl)
+    return _GLOBAL_DESCRIBE_CACHE["index"]
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        data: Raw response body (response.content)
+
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any, indent: bool = False) -> str:
+    """
+    Encode a value as a JSON string, using orjson when it is installed.
+
+    Args:
+        value: Value to encode
+        indent: Whether to pretty-print with a two-space indent
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(value, option=option).decode()
+    return json.dumps(value, indent=2 if indent else None)
+
+
+# =================================================================
+# DISK CACHE FILES
+# =================================================================
+# Gzipped JSON files under DESCRIBE_CACHE_DIR, shared by the global describe
+# cache and tools/_describe_cache.py. Disk errors are logged and otherwise
+# ignored; the caches on disk are only an optimization and must never make a
+# tool call fail. A None path (persistence disabled) is a no-op.
+# =================================================================
+
+
+def cache_file_mtime(path: Optional[str]) -> Optional[float]:
+    """Return the modification time of a cache file, or None if missing."""
+    if path is None:
+        return None
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def read_cache_file(path: str) -> Any:
+    """Read the value stored in a cache file, or None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return json_loads(gzip.decompress(f.read()))
+    except (OSError, ValueError) as e:
+        logger.warning("Could not read cache file %s: %s", path, e)
+        return None
+
+
+def write_cache_file(path: Optional[str], value: Any) -> None:
+    """Atomically write a value to a cache file."""
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(json_dumps(value).encode(), compresslevel=3))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write cache file %s: %s", path, e)
+
+
+def touch_cache_file(path: Optional[str]) -> None:
+    """Mark a cache file as freshly validated."""
+    if path is None or not os.path.exists(path):
+        return
+    try:
+        os.utime(path)
+    except OSError as e:
+        logger.warning("Could not update cache file %s: %s", path, e)
+
+
+def remove_cache_file(path: Optional[str]) -> None:
+    """Remove a cache file if it exists."""
+    if path is None:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Could not remove cache file %s: %s", path, e)
+
+
+def request_json(sf: "Salesforce", method: str, path: str, **kwargs) -> Any:
+    """
+    Make a REST API request and decode the JSON response with json_loads.
+
+    Equivalent to sf.restful(), which always decodes with the stdlib json
+    module, for the large payloads (describes) on the hot path.
+
+    Args:
+        sf: Salesforce connection
+        method: HTTP method (e.g., 'GET', 'POST')
+        path: Path relative to the REST base URL (e.g., 'sobjects/Account/describe')
+        **kwargs: Passed through to requests (e.g., json=payload)
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        SalesforceError: Subclass matching the error status code
+
+    Examples:
+        describe = request_json(sf, "GET", "sobjects/Account/describe")
+    """
+    response = sf.session.request(
+        method, f"{sf.base_url}{path}", headers=sf.headers, **kwargs
+    )
+    if response.status_code >= 300:
+        from simple_salesforce.util import exception_handler
+
+        exception_handler(response, path)
+    return json_loads(response.content)
+
+
+# Object and field API names are checked before they are used in a request
+# or query, so a malformed name from the LLM is rejected without a wasted
+# round trip and cannot change a query's structure. Covers standard names and
+# namespaced/suffixed custom names such as ns__Invoice__c, Account__History
+# or Event__e.
+_VALID_API_NAME = re.compile(r"[A-Za-z][A-Za-z0-9_]{0,79}")
+
+
+def validate_api_name(value: str, kind: str = "object") -> Optional[str]:
+    """Return an error message if value is not a valid API name, else None."""
+    if not value or not value.strip():
+        return f"Error: {kind.capitalize()} name is required"
+    if not _VALID_API_NAME.fullmatch(value):
+        return f"Error: Invalid {kind} name '{value}'"
+    return None
+
+
+# Characters that must be backslash-escaped inside a SOQL string literal
+_SOQL_ESCAPE_MAP = {
+    "\\": "\\\\",
+    "'": "\\'",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+    "\b": "\\b",
+    "\f": "\\f",
+}
+_SOQL_ESCAPES = str.maketrans(_SOQL_ESCAPE_MAP)
+
+
+def soql_quote(value: str) -> str:
+    """
+    Quote a value as a SOQL string literal.
+
+    Args:
+        value: Value to compare against in a WHERE clause
+
+    Returns:
+        The value in single quotes, with quotes and control characters escaped
+
+    Examples:
+        soql = f"SELECT Id FROM Account WHERE Name = {soql_quote(name)}"
+    """
+    return f"'{value.translate(_SOQL_ESCAPES)}'"
+
+
+# SOQL string literal escapes plus the LIKE wildcards
+_SOQL_LIKE_ESCAPES = str.maketrans({**_SOQL_ESCAPE_MAP, "%": "\\%", "_": "\\_"})
+
+
+def soql_quote_like(value: str) -> str:
+    """
+    Quote a LIKE pattern matching any string that contains a value.
+
+    Args:
+        value: Text to search for; % and _ in it match only themselves
+
+    Returns:
+        The value escaped, wrapped in % wildcards and in single quotes
+
+    Examples:
+        soql = f"SELECT Id FROM User WHERE Name LIKE {soql_quote_like(name)}"
+    """
+    return f"'%{value.translate(_SOQL_LIKE_ESCAPES)}%'"
+
+
+# Error codes by HTTP status, for format_error
+_ERROR_CODES = {
+    300: "E_BAD_REQUEST",
+    400: "E_BAD_REQUEST",
+    401: "E_AUTH",
+    403: "E_FORBIDDEN",
+    404: "E_NOT_FOUND",
+    429: "E_RATE_LIMIT",
+    502: "E_UNAVAILABLE",
+    503: "E_UNAVAILABLE",
+    504: "E_UNAVAILABLE",
+}
+
+# Longest error detail included in a tool result
+_MAX_ERROR_DETAIL = 300
+
+
+def format_error(e: Exception, context: str) -> str:
+    """
+    Format an exception as a compact tool error result.
+
+    simple_salesforce exceptions render the full response body, which can run
+    to several KB. Instead the exception is classified into a short code and
+    only the first Salesforce error (errorCode and message) is kept, saving
+    tokens in the LLM's context.
+
+    Codes: E_AUTH, E_FORBIDDEN, E_NOT_FOUND, E_BAD_REQUEST, E_RATE_LIMIT,
+    E_UNAVAILABLE, E_SALESFORCE, E_NETWORK, E_INTERNAL
+
+    Args:
+        e: The exception raised
+        context: What was being done (e.g., 'describing object Account')
+
+    Returns:
+        Error message of the form "Error <context>: [<code>] <detail>"
+
+    Examples:
+        except Exception as e:
+            return format_error(e, f"describing object {object_name}")
+    """
+    from simple_salesforce.exceptions import (
+        SalesforceAuthenticationFailed,
+        SalesforceError,
+    )
+
+    if isinstance(e, SalesforceAuthenticationFailed):
+        code, detail = "E_AUTH", str(e)
+    elif isinstance(e, SalesforceError):
+        detail = _salesforce_error_detail(e.content) or f"HTTP {e.status}"
+        code = _ERROR_CODES.get(e.status, "E_SALESFORCE")
+    elif isinstance(e, requests.HTTPError) and e.response is not None:
+        status = e.response.status_code
+        # Failures against the OAuth token endpoint are authentication errors
+        if "/oauth2/" in (e.response.url or "") and status in (400, 401):
+            code = "E_AUTH"
+        else:
+            code = _ERROR_CODES.get(status, "E_SALESFORCE")
+        detail = _http_error_detail(e.response)
+    elif isinstance(e, requests.exceptions.RetryError):
+        code, detail = "E_UNAVAILABLE", "Salesforce kept failing after retries"
+    elif isinstance(e, (requests.ConnectionError, requests.Timeout)):
+        code, detail = "E_NETWORK", type(e).__name__
+    else:
+        code, detail = "E_INTERNAL", str(e)
+
+    # Salesforce reports exhausted API limits as 403 REQUEST_LIMIT_EXCEEDED
+    if "REQUEST_LIMIT_EXCEEDED" in detail:
+        code = "E_RATE_LIMIT"
+
+    if len(detail) > _MAX_ERROR_DETAIL:
+        detail = detail[:_MAX_ERROR_DETAIL] + "..."
+    return f"Error {context}: [{code}] {detail}"
+
+
+def _http_error_detail(response: requests.Response) -> str:
+    """Return the Salesforce error in a failed response, or its status line."""
+    try:
+        detail = _salesforce_error_detail(json_loads(response.content))
+    except ValueError:
+        detail = ""
+    return detail or f"HTTP {response.status_code} {response.reason or ''}".strip()
+
+
+def _salesforce_error_detail(content: Any) -> str:
+    """Return 'errorCode: message' for the first error in a Salesforce error body."""
+    if isinstance(content, list) and content and isinstance(content[0], dict):
+        content = content[0]
+    if isinstance(content, dict):
+        error_code = content.get("errorCode") or content.get("error") or "ERROR"
+        message = content.get("message") or content.get("error_description") or ""
+        return f"{error_code}: {message}"
+    if isinstance(content, bytes):
+        content = content.decode(errors="replace")
+    return str(content or "")
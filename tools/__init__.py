@@ -8,6 +8,9 @@ This package provides organized functionality for:
 - Debug logs management
 """
 
+# Shared describe cache
+from ._describe_cache import DESCRIBE_CACHE_TTL, clear_describes
+
 # Object schema tools
 from .search_objects import search_objects
 from .describe_object import describe_object
@@ -15,6 +18,7 @@ from .describe_object_with_api import describe_object_with_api
 from .get_picklist_values import get_picklist_values
 from .describe_relationship_fields import describe_relationship_fields
 from .get_fields_by_type import get_fields_by_type
+from .describe_objects_batch import fetch_describes_batch, describe_objects_batch
 
 # Record query tools
 from .query_records import query_records
@@ -0,0 +1,332 @@
+"""
+Shared cache of raw Salesforce describe results
+
+Several tools need the describe result for the same object (schema, picklists,
+relationships, fields by type). This module keeps the raw describe dict for
+each object and API version in a process-local TTL cache so those tools share
+one fetch and only differ in how they format it. The API version defaults to
+the connection's version.
+
+Functions:
+- get_describe: Returns the describe for an object, fetching it on a miss
+- peek_describe: Returns the describe for an object only if it is already cached
+- put_describe: Stores a describe fetched elsewhere (e.g. a batch describe)
+- get_derived: Returns a value computed from a describe, computing it once per fetch
+- clear_describes: Removes one or all cached describes
+
+The TTL defaults to 600 seconds and can be set with the
+SALESFORCE_DESCRIBE_CACHE_TTL environment variable. An expired describe is
+revalidated with If-Modified-Since using the Last-Modified header of the
+response it came from; if Salesforce answers 304 the cached copy (and
+anything derived from it) is kept for another TTL without re-downloading.
+
+Describes are also persisted as gzipped JSON under
+~/.cache/sf-mcp/describe/<instance>/v<version>/ so a restarted server does not have to
+re-fetch them. A file older than the TTL is revalidated with If-Modified-Since,
+so an unchanged object costs a 304 instead of the full payload. Set
+SALESFORCE_DESCRIBE_CACHE_DIR to change the location, or to an empty string to
+disable persistence.
+
+Cached describes are shared, not copied: every caller gets the same object,
+wrapped in a read-only mapping so its top-level keys cannot be replaced.
+The wrapper is shallow: the nested lists and dicts (describe["fields"] and
+each field) are the cached objects themselves and must not be modified, e.g.
+sorted in place. Callers that need to change them must copy them first.
+"""
+
+from email.utils import formatdate
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+from sf_connection import (
+    DESCRIBE_CACHE_DIR,
+    cache_file_mtime,
+    get_connection,
+    json_loads,
+    read_cache_file,
+    touch_cache_file,
+    write_cache_file,
+)
+import logging
+import os
+import re
+import threading
+import time
+
+# Configure logging
+logger = logging.getLogger("sf_mcp_server.describe_cache")
+
+DESCRIBE_CACHE_TTL = float(os.environ.get("SALESFORCE_DESCRIBE_CACHE_TTL", "600"))
+
+# Only names that are safe to use as file names are persisted
+_PERSISTABLE_NAME = re.compile(r"\w+", re.ASCII)
+
+# (object name, API version) -> (expiry on the monotonic clock, describe result,
+# derived values, Last-Modified header for revalidation)
+_CACHE: Dict[tuple, tuple] = {}
+_LOCK = threading.Lock()
+
+
+def get_describe(
+    object_name: str, api_version: Optional[str] = None
+) -> Mapping[str, Any]:
+    """
+    Get the describe result for a Salesforce object, using the cache if fresh.
+
+    Args:
+        object_name: API name of the object (e.g., 'Account', 'Custom_Object__c')
+        api_version: REST API version (e.g., '63.0'); defaults to the connection's
+
+    Returns:
+        Raw describe result as returned by Salesforce, as a (shallow)
+        read-only mapping shared with other callers
+
+    Examples:
+        describe = get_describe("Account")
+        describe = get_describe("Account", api_version="63.0")
+    """
+    return _get_entry(object_name, api_version)[1]
+
+
+def peek_describe(
+    object_name: str, api_version: Optional[str] = None
+) -> Optional[Mapping[str, Any]]:
+    """
+    Get the cached describe result for a Salesforce object without fetching it.
+
+    Args:
+        object_name: API name of the object
+        api_version: REST API version; defaults to the connection's
+
+    Returns:
+        Raw describe result, or None if it is not in the in-memory cache
+    """
+    with _LOCK:
+        entry = _CACHE.get((object_name, _api_version(api_version)))
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def _api_version(api_version: Optional[str] = None) -> str:
+    """Normalize an API version ('v63.0' -> '63.0'), defaulting to the connection's."""
+    return (api_version or get_connection().sf_version).lstrip("v")
+
+
+def _get_entry(object_name: str, api_version: Optional[str] = None) -> tuple:
+    """Return the fresh cache entry for an object, fetching the describe on a miss."""
+    version = _api_version(api_version)
+    with _LOCK:
+        entry = _CACHE.get((object_name, version))
+    if entry is not None and time.monotonic() < entry[0]:
+        logger.debug("Describe cache hit for %s (v%s)", object_name, version)
+        return entry
+
+    logger.debug("Describe cache miss for %s (v%s)", object_name, version)
+    path = _disk_path(object_name, version)
+    if entry is not None:
+        # Expired in memory: revalidate against the Last-Modified we last saw
+        since = entry[3]
+    else:
+        since = None
+        mtime = cache_file_mtime(path)
+        if mtime is not None:
+            age = time.time() - mtime
+            if age < DESCRIBE_CACHE_TTL:
+                describe = read_cache_file(path)
+                if describe is not None:
+                    logger.debug("Loaded describe for %s from %s", object_name, path)
+                    return _store(
+                        object_name,
+                        version,
+                        describe,
+                        DESCRIBE_CACHE_TTL - age,
+                        formatdate(mtime, usegmt=True),
+                    )
+            since = formatdate(mtime, usegmt=True)
+
+    describe, last_modified = _fetch_describe(object_name, version, since)
+    if describe is None:
+        # 304 Not Modified: the copy in memory or on disk is still current
+        if entry is not None:
+            logger.debug("Describe for %s not modified, extending TTL", object_name)
+            touch_cache_file(path)
+            return _store(
+                object_name, version, entry[1], DESCRIBE_CACHE_TTL, entry[3], entry[2]
+            )
+        describe = read_cache_file(path)
+        if describe is not None:
+            logger.debug("Describe for %s not modified, using %s", object_name, path)
+            touch_cache_file(path)
+            return _store(object_name, version, describe, DESCRIBE_CACHE_TTL, since)
+        describe, last_modified = _fetch_describe(object_name, version)
+    return put_describe(object_name, describe, version, last_modified)
+
+
+def _fetch_describe(
+    object_name: str, version: str, if_modified_since: Optional[str] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch a describe from Salesforce.
+
+    Returns a (describe, Last-Modified header) tuple. The describe is None if
+    if_modified_since is given and the object is unchanged (304), in which
+    case the response body is neither downloaded nor parsed.
+    """
+    sf = get_connection()
+    headers = dict(sf.headers)
+    if if_modified_since:
+        headers["If-Modified-Since"] = if_modified_since
+
+    response = sf.session.get(
+        f"https://{sf.sf_instance}/services/data/v{version}/sobjects/{object_name}/describe",
+        headers=headers,
+    )
+    if response.status_code == 304 and if_modified_since:
+        return None, if_modified_since
+    if response.status_code >= 300:
+        from simple_salesforce.util import exception_handler
+
+        exception_handler(response, object_name)
+    return json_loads(response.content), response.headers.get("Last-Modified")
+
+
+def put_describe(
+    object_name: str,
+    describe: Dict[str, Any],
+    api_version: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> tuple:
+    """
+    Store a describe result for a Salesforce object in the cache.
+
+    Any values previously derived from the object's describe are dropped, and
+    the describe is written to the disk cache.
+
+    Args:
+        object_name: API name of the object
+        describe: Raw describe result for the object
+        api_version: REST API version it was fetched with; defaults to the connection's
+        last_modified: Last-Modified header of the describe response; defaults
+                       to now, the latest time the describe is known current
+
+    Returns:
+        The new cache entry
+    """
+    version = _api_version(api_version)
+    if last_modified is None:
+        last_modified = formatdate(usegmt=True)
+    write_cache_file(_disk_path(object_name, version), describe)
+    return _store(object_name, version, describe, DESCRIBE_CACHE_TTL, last_modified)
+
+
+def _store(
+    object_name: str,
+    version: str,
+    describe: Mapping[str, Any],
+    ttl: float,
+    last_modified: Optional[str] = None,
+    derived: Optional[Dict[Hashable, Any]] = None,
+) -> tuple:
+    """Store a describe in the in-memory cache for ttl seconds."""
+    if not isinstance(describe, MappingProxyType):
+        describe = MappingProxyType(describe)
+    entry = (time.monotonic() + ttl, describe, derived or {}, last_modified)
+    with _LOCK:
+        _CACHE[(object_name, version)] = entry
+    return entry
+
+
+def get_derived(
+    object_name: str,
+    key: Hashable,
+    builder: Callable[[Mapping[str, Any]], Any],
+    api_version: Optional[str] = None,
+) -> Any:
+    """
+    Get a value computed from an object's describe, computing it at most once.
+
+    Derived values (indexes, formatted tables, serialized JSON) are stored
+    alongside the cached describe, so they expire and are invalidated together
+    with it.
+
+    Args:
+        object_name: API name of the object
+        key: Identifies the derived value (e.g., ('fields_by_type', 'picklist'))
+        builder: Function computing the value from the raw describe
+        api_version: REST API version of the describe; defaults to the connection's
+
+    Returns:
+        The derived value
+
+    Examples:
+        index = get_derived("Account", "fields_by_type", group_fields_by_type)
+    """
+    entry = _get_entry(object_name, api_version)
+    derived = entry[2]
+    if key in derived:
+        return derived[key]
+
+    value = builder(entry[1])
+    with _LOCK:
+        return derived.setdefault(key, value)
+
+
+def clear_describes(object_name: Optional[str] = None) -> int:
+    """
+    Remove cached describe results for every API version, in memory and on disk.
+
+    Args:
+        object_name: API name of a single object to remove; all objects if None
+
+    Returns:
+        Number of cached describes removed
+    """
+    with _LOCK:
+        keys = [k for k in _CACHE if not object_name or k[0] == object_name]
+        for key in keys:
+            del _CACHE[key]
+
+    _remove_disk(object_name)
+    return len(keys)
+
+
+# =================================================================
+# DISK PERSISTENCE
+# =================================================================
+# Files are read and written with the shared cache file helpers in
+# sf_connection, which log and otherwise ignore disk errors.
+# =================================================================
+
+
+def _disk_dir() -> Optional[str]:
+    """Return the cache directory for the connected org, or None if disabled."""
+    if not DESCRIBE_CACHE_DIR:
+        return None
+    return os.path.join(DESCRIBE_CACHE_DIR, get_connection().sf_instance)
+
+
+def _disk_path(object_name: str, version: str) -> Optional[str]:
+    """Return the cache file path for an object, or None if not persisted."""
+    if not _PERSISTABLE_NAME.fullmatch(object_name):
+        return None
+    directory = _disk_dir()
+    if directory is None:
+        return None
+    return os.path.join(directory, f"v{version}", f"{object_name}.json.gz")
+
+
+def _remove_disk(object_name: Optional[str] = None) -> None:
+    """Remove the cache files for one object, or all cache files for the org."""
+    target = f"{object_name}.json.gz" if object_name else None
+    try:
+        directory = _disk_dir()
+        if directory is None:
+            return
+        for root, _, file_names in os.walk(directory):
+            for file_name in file_names:
+                if file_name == target or (
+                    target is None and file_name.endswith(".json.gz")
+                ):
+                    os.remove(os.path.join(root, file_name))
+    except OSError as e:
+        logger.warning("Could not remove describe cache files: %s", e)
@@ -0,0 +1,142 @@
+"""
+Shared markdown formatting for Salesforce describe results
+
+describe_object and describe_object_with_api render the same fields,
+relationship fields and picklist sections. The helpers here build those
+sections as lists of strings for the caller to extend its output with.
+
+Functions:
+- format_fields_table: Fields table, plus the reference and picklist fields found
+- format_reference_table: Relationship fields table
+- format_picklist_sections: One values table per picklist field
+"""
+
+from typing import Any, Dict, List, Tuple
+
+PICKLIST_TYPES = frozenset({"picklist", "multipicklist"})
+
+# Table row templates, %-formatted in the per-field and per-value loops
+_FIELD_ROW = "| %s | %s | %s | %s | %s | %s |\n"
+_REFERENCE_ROW = "| %s | %s | %s |\n"
+_PICKLIST_ROW = "| %s | %s | %s |\n"
+_PICKLIST_ACTIVE_ROW = "| %s | %s | %s | %s |\n"
+
+
+def format_fields_table(
+    fields: List[Dict[str, Any]],
+) -> Tuple[List[str], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Format the fields of a describe as a markdown table.
+
+    The reference and picklist fields are collected in the same pass over the
+    fields, ready for format_reference_table and format_picklist_sections.
+
+    Args:
+        fields: The 'fields' list of a describe result
+
+    Returns:
+        Tuple of (table lines, reference fields, picklist fields)
+    """
+    parts = [
+        "| API Name | Label | Type | Required | Unique | External ID |\n",
+        "|----------|-------|------|----------|--------|------------|\n",
+    ]
+    reference_fields = []
+    picklist_fields = []
+    for field in fields:
+        field_type = field["type"]
+        parts.append(
+            _FIELD_ROW
+            % (
+                field["name"],
+                field["label"],
+                field_type,
+                "Yes" if not field.get("nillable", True) else "No",
+                "Yes" if field.get("unique", False) else "No",
+                "Yes" if field.get("externalId", False) else "No",
+            )
+        )
+        if field_type == "reference" and field.get("referenceTo"):
+            reference_fields.append(field)
+        elif field_type in PICKLIST_TYPES and field.get("picklistValues"):
+            picklist_fields.append(field)
+
+    return parts, reference_fields, picklist_fields
+
+
+def format_reference_table(reference_fields: List[Dict[str, Any]]) -> List[str]:
+    """
+    Format lookup and master-detail fields as a markdown table.
+
+    Args:
+        reference_fields: Reference fields from format_fields_table
+
+    Returns:
+        Table lines, including the section heading
+    """
+    parts = [
+        "\n## Relationship Fields\n\n",
+        "| API Name | Related To | Relationship Name |\n",
+        "|----------|-----------|-------------------|\n",
+    ]
+    parts.extend(
+        [
+            _REFERENCE_ROW
+            % (
+                field["name"],
+                ", ".join(field["referenceTo"]),
+                field.get("relationshipName", "N/A"),
+            )
+            for field in reference_fields
+        ]
+    )
+    return parts
+
+
+def format_picklist_sections(
+    picklist_fields: List[Dict[str, Any]], include_active: bool = False
+) -> List[str]:
+    """
+    Format the values of each picklist field as a markdown table.
+
+    Args:
+        picklist_fields: Picklist fields from format_fields_table
+        include_active: Whether to add an Active column for each value
+
+    Returns:
+        Section lines, including the section heading
+    """
+    parts = ["\n## Picklist Fields\n\n"]
+    for field in picklist_fields:
+        parts.append(f"### {field['label']} ({field['name']})\n\n")
+        if include_active:
+            parts.append("| Value | Label | Default | Active |\n")
+            parts.append("|-------|-------|---------|--------|\n")
+            parts.extend(
+                [
+                    _PICKLIST_ACTIVE_ROW
+                    % (
+                        value["value"],
+                        value["label"],
+                        "Yes" if value.get("defaultValue", False) else "No",
+                        "Yes" if value.get("active", True) else "No",
+                    )
+                    for value in field["picklistValues"]
+                ]
+            )
+        else:
+            parts.append("| Value | Label | Default |\n")
+            parts.append("|-------|-------|--------|\n")
+            parts.extend(
+                [
+                    _PICKLIST_ROW
+                    % (
+                        value["value"],
+                        value["label"],
+                        "Yes" if value.get("defaultValue", False) else "No",
+                    )
+                    for value in field["picklistValues"]
+                ]
+            )
+        parts.append("\n")
+    return parts
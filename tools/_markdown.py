@@ -0,0 +1,26 @@
+"""
+Shared helpers for building markdown tables
+
+Functions:
+- escape_cell: Makes a value safe to place in a markdown table cell
+"""
+
+# Line breaks end a table row and pipes start a new cell, so both are replaced
+# in a single str.translate pass
+CELL_ESCAPES = str.maketrans({"\n": " ", "\r": " ", "|": "\\|"})
+
+
+def escape_cell(value: object) -> str:
+    """
+    Format a value for a markdown table cell.
+
+    Args:
+        value: Value to show in the cell; non-strings are converted with str()
+
+    Returns:
+        The text with line breaks replaced by spaces and pipes escaped
+
+    Examples:
+        escape_cell("Closed | Won")  # 'Closed \\| Won'
+    """
+    return str(value).translate(CELL_ESCAPES)
@@ -12,7 +12,14 @@ This is useful for understanding the structure of Salesforce objects, their
 available fields, and relationships to other objects in the system.
 """
 
-from sf_connection import get_connection
+from typing import Iterator
+from sf_connection import format_error
+from ._describe_cache import get_derived
+from ._describe_format import (
+    format_fields_table,
+    format_picklist_sections,
+    format_reference_table,
+)
 import logging
 
 # Configure logging
@@ -51,81 +58,80 @@ def describe_object(object_name: str, include_field_details: bool = True) -> str
         # Get only basic object info without field details
         describe_object("Opportunity", include_field_details=False)
     """
-    logger.info(f"Describing Salesforce object: {object_name}")
-    sf = get_connection()
+    logger.info("Describing Salesforce object: %s", object_name)
 
     try:
-        # Get object describe info using the Salesforce API
-        logger.debug(f"Fetching describe information for {object_name}")
-        describe = sf.__getattr__(object_name).describe()
-        logger.info(f"Successfully retrieved metadata for {object_name}")
-
-        # Format basic object information section
-        result = f"## {describe['label']} ({describe['name']})\n\n"
-        result += f"**Type:** {'Custom Object' if describe['custom'] else 'Standard Object'}\n"
-        result += f"**API Name:** {describe['name']}\n"
-        result += f"**Label:** {describe['label']}\n"
-        result += f"**Plural Label:** {describe['labelPlural']}\n"
-        result += f"**Key Prefix:** {describe.get('keyPrefix', 'N/A')}\n"
-        result += f"**Createable:** {describe['createable']}\n"
-        result += f"**Updateable:** {describe['updateable']}\n"
-        result += f"**Deletable:** {describe['deletable']}\n\n"
-
-        # Only include detailed field information if requested
-        if include_field_details:
-            # Format fields table
-            result += "## Fields\n\n"
-            result += "| API Name | Label | Type | Required | Unique | External ID |\n"
-            result += "|----------|-------|------|----------|--------|------------|\n"
-
-            for field in describe["fields"]:
-                required = "Yes" if not field["nillable"] else "No"
-                unique = "Yes" if field.get("unique", False) else "No"
-                external_id = "Yes" if field.get("externalId", False) else "No"
-
-                result += f"| {field['name']} | {field['label']} | {field['type']} | {required} | {unique} | {external_id} |\n"
-
-            # Add reference fields section if there are any
-            reference_fields = [
-                f
-                for f in describe["fields"]
-                if f["type"] == "reference" and f.get("referenceTo")
-            ]
-            if reference_fields:
-                result += "\n## Relationship Fields\n\n"
-                result += "| API Name | Related To | Relationship Name |\n"
-                result += "|----------|-----------|-------------------|\n"
-
-                for field in reference_fields:
-                    related_to = ", ".join(field["referenceTo"])
-                    rel_name = field.get("relationshipName", "N/A")
-                    result += f"| {field['name']} | {related_to} | {rel_name} |\n"
-
-            # Add picklist fields section if there are any
-            picklist_fields = [
-                f
-                for f in describe["fields"]
-                if f["type"] in ("picklist", "multipicklist")
-                and f.get("picklistValues")
-            ]
-            if picklist_fields:
-                result += "\n## Picklist Fields\n\n"
-
-                for field in picklist_fields:
-                    result += f"### {field['label']} ({field['name']})\n\n"
-                    result += "| Value | Label | Default |\n"
-                    result += "|-------|-------|--------|\n"
-
-                    for value in field["picklistValues"]:
-                        is_default = "Yes" if value.get("defaultValue", False) else "No"
-                        result += (
-                            f"| {value['value']} | {value['label']} | {is_default} |\n"
-                        )
-
-                    result += "\n"
-
-        return result
+        # The describe is shared with the other describe-based tools, and the
+        # formatted markdown is cached with it
+        logger.debug("Fetching describe information for %s", object_name)
+        return get_derived(
+            object_name,
+            ("markdown", include_field_details),
+            lambda describe: format_object_describe(describe, include_field_details),
+        )
 
     except Exception as e:
-        logger.error(f"Error describing object {object_name}: {str(e)}")
-        return f"Error describing object {object_name}: {str(e)}"
+        logger.error("Error describing object %s: %s", object_name, e)
+        return format_error(e, f"describing object {object_name}")
+
+
+def format_object_describe(describe: dict, include_field_details: bool = True) -> str:
+    """
+    Format an object describe result as markdown.
+
+    This is the formatting half of describe_object, split out so callers that
+    already hold a describe result (e.g. from a batch describe) can render it
+    without another API call.
+
+    Args:
+        describe: Describe result for a single object as returned by Salesforce
+        include_field_details: Whether to include detailed field information (default: True)
+
+    Returns:
+        Formatted markdown text with object schema details
+    """
+    return "".join(iter_object_describe(describe, include_field_details))
+
+
+def iter_object_describe(
+    describe: dict, include_field_details: bool = True
+) -> Iterator[str]:
+    """
+    Yield the markdown for an object describe result in chunks.
+
+    format_object_describe joins these chunks; callers that write the output
+    incrementally can consume them directly without building the full string.
+
+    Args:
+        describe: Describe result for a single object as returned by Salesforce
+        include_field_details: Whether to include detailed field information (default: True)
+
+    Yields:
+        Consecutive pieces of the formatted markdown text
+    """
+    # Format basic object information section
+    yield f"## {describe['label']} ({describe['name']})\n\n"
+    yield f"**Type:** {'Custom Object' if describe['custom'] else 'Standard Object'}\n"
+    yield f"**API Name:** {describe['name']}\n"
+    yield f"**Label:** {describe['label']}\n"
+    yield f"**Plural Label:** {describe['labelPlural']}\n"
+    yield f"**Key Prefix:** {describe.get('keyPrefix', 'N/A')}\n"
+    yield f"**Createable:** {describe['createable']}\n"
+    yield f"**Updateable:** {describe['updateable']}\n"
+    yield f"**Deletable:** {describe['deletable']}\n\n"
+
+    # Only include detailed field information if requested
+    if include_field_details:
+        yield "## Fields\n\n"
+        rows, reference_fields, picklist_fields = format_fields_table(
+            describe["fields"]
+        )
+        yield from rows
+
+        # Add reference fields section if there are any
+        if reference_fields:
+            yield from format_reference_table(reference_fields)
+
+        # Add picklist fields section if there are any
+        if picklist_fields:
+            yield from format_picklist_sections(picklist_fields)
@@ -12,15 +12,31 @@ This is particularly useful when:
 - You're troubleshooting object configurations or permissions
 """
 
-from sf_connection import get_connection
+from typing import Any, Iterator, Mapping
+from sf_connection import json_dumps, format_error
+from ._describe_cache import get_derived
+from ._describe_format import (
+    format_fields_table,
+    format_picklist_sections,
+    format_reference_table,
+)
 import logging
-import json
 
 # Configure logging
 logger = logging.getLogger("sf_mcp_server.describe_object_with_api")
 
+# REST API version used for the describe call; update this as needed
+API_VERSION = "63.0"
 
-def describe_object_with_api(object_name: str, raw_json: bool = False) -> str:
+# Table row templates, %-formatted in the per-row loops
+_PROPERTY_ROW = "| %s | %s |\n"
+_CHILD_ROW = "| %s | %s | %s | %s |\n"
+_RECORD_TYPE_ROW = "| %s | %s | %s | %s | %s |\n"
+
+
+def describe_object_with_api(
+    object_name: str, raw_json: bool = False, max_fields: int = 500
+) -> str:
     """
     Get detailed schema information for a Salesforce object using direct REST API calls.
 
@@ -35,11 +51,15 @@ def describe_object_with_api(object_name: str, raw_json: bool = False) -> str:
     - Picklist values with all metadata
 
     When raw_json=True, it returns the complete unfiltered JSON response,
-    which is useful for technical analysis or debugging.
+    which is useful for technical analysis or debugging. Objects with more than
+    max_fields fields have their field list cut to the first max_fields entries,
+    marked with "_truncated": true and "_total_fields": N, to keep the response
+    to a size the client can handle.
 
     Args:
         object_name: API name of the object (e.g., 'Account', 'Contact', 'Custom_Object__c')
         raw_json: If True, returns the raw JSON response instead of formatted markdown (default: False)
+        max_fields: Maximum number of fields in raw JSON output; 0 for no limit (default: 500)
 
     Returns:
         Formatted markdown with object schema details or raw JSON string if raw_json=True
@@ -54,143 +74,129 @@ def describe_object_with_api(object_name: str, raw_json: bool = False) -> str:
         # Get complete technical details for Opportunity
         describe_object_with_api("Opportunity")
     """
-    logger.info(f"Describing Salesforce object {object_name} with direct API call")
-    sf = get_connection()
-
+    logger.info("Describing Salesforce object %s with direct API call", object_name)
     try:
-        # Extract instance URL from base_url
-        instance_url = sf.base_url.split("/services/data")[0]
-
-        # Use the appropriate API version
-        api_version = "v63.0"  # Update this as needed
-
-        # Build the describe URL
-        url = f"{instance_url}/services/data/{api_version}/sobjects/{object_name}/describe/"
-        logger.debug(f"Making API request to: {url}")
-
-        # Make the direct API call
-        response = sf.session.get(url, headers=sf.headers)
-        response.raise_for_status()
-
-        # Get the full describe result with all metadata
-        describe = response.json()
-        logger.debug(f"Retrieved {len(describe)} metadata properties for {object_name}")
-
-        # If raw_json is requested, return the complete JSON response as a formatted string
+        # The describe is cached per API version, and so are its renderings
         if raw_json:
-            logger.info(f"Returning raw JSON for {object_name}")
-            return json.dumps(describe, indent=2)
-
-        # Format basic object information
-        result = f"## {describe['label']} ({describe['name']})\n\n"
-        result += f"**Type:** {'Custom Object' if describe.get('custom', False) else 'Standard Object'}\n"
-        result += f"**API Name:** {describe['name']}\n"
-        result += f"**Label:** {describe['label']}\n"
-        result += f"**Plural Label:** {describe.get('labelPlural', 'N/A')}\n"
-        result += f"**Key Prefix:** {describe.get('keyPrefix', 'N/A')}\n"
-
-        # Add all object properties
-        result += "\n## Object Properties\n\n"
-        result += "| Property | Value |\n"
-        result += "|----------|-------|\n"
-
-        # Include all boolean properties from the raw describe
-        for prop in sorted(
-            [p for p in describe.keys() if isinstance(describe[p], bool)]
-        ):
-            result += f"| {prop} | {describe[p]} |\n"
-
-        # Add fields section
-        if "fields" in describe:
-            result += "\n## Fields\n\n"
-            result += "| API Name | Label | Type | Required | Unique | External ID |\n"
-            result += "|----------|-------|------|----------|--------|------------|\n"
-
-            for field in describe["fields"]:
-                required = "Yes" if not field.get("nillable", True) else "No"
-                unique = "Yes" if field.get("unique", False) else "No"
-                external_id = "Yes" if field.get("externalId", False) else "No"
-
-                result += f"| {field['name']} | {field['label']} | {field['type']} | {required} | {unique} | {external_id} |\n"
-
-            # Add reference fields section if there are any
-            reference_fields = [
-                f
-                for f in describe["fields"]
-                if f["type"] == "reference" and f.get("referenceTo")
-            ]
-            if reference_fields:
-                result += "\n## Relationship Fields\n\n"
-                result += "| API Name | Related To | Relationship Name |\n"
-                result += "|----------|-----------|-------------------|\n"
-
-                for field in reference_fields:
-                    related_to = ", ".join(field["referenceTo"])
-                    rel_name = field.get("relationshipName", "N/A")
-                    result += f"| {field['name']} | {related_to} | {rel_name} |\n"
-
-            # Add picklist fields section if there are any
-            picklist_fields = [
-                f
-                for f in describe["fields"]
-                if f["type"] in ("picklist", "multipicklist")
-                and f.get("picklistValues")
-            ]
-            if picklist_fields:
-                result += "\n## Picklist Fields\n\n"
-
-                for field in picklist_fields:
-                    result += f"### {field['label']} ({field['name']})\n\n"
-                    result += "| Value | Label | Default | Active |\n"
-                    result += "|-------|-------|---------|--------|\n"
-
-                    for value in field["picklistValues"]:
-                        is_default = "Yes" if value.get("defaultValue", False) else "No"
-                        is_active = "Yes" if value.get("active", True) else "No"
-                        result += f"| {value['value']} | {value['label']} | {is_default} | {is_active} |\n"
-
-                    result += "\n"
-
-        # Include child relationships
-        if "childRelationships" in describe and describe["childRelationships"]:
-            result += "\n## Child Relationships\n\n"
-            result += "| Child Object | Relationship Name | Field | Cascade Delete |\n"
-            result += "|-------------|------------------|-------|---------------|\n"
-
-            for rel in describe["childRelationships"]:
-                child_obj = rel.get("childSObject", "N/A")
-                rel_name = (
-                    rel.get("relationshipName", "N/A")
-                    if rel.get("relationshipName")
-                    else "N/A"
-                )
-                field = rel.get("field", "N/A")
-                cascade = "Yes" if rel.get("cascadeDelete", False) else "No"
-
-                result += f"| {child_obj} | {rel_name} | {field} | {cascade} |\n"
-
-        # Include record types if present
-        if "recordTypeInfos" in describe and describe["recordTypeInfos"]:
-            result += "\n## Record Types\n\n"
-            result += "| Record Type ID | Name | Developer Name | Default | Active |\n"
-            result += "|---------------|------|----------------|---------|--------|\n"
-
-            for rt in describe["recordTypeInfos"]:
-                rt_id = rt.get("recordTypeId", "N/A")
-                name = rt.get("name", "N/A")
-                dev_name = rt.get("developerName", "N/A")
-                is_default = (
-                    "Yes" if rt.get("defaultRecordTypeMapping", False) else "No"
-                )
-                is_active = "Yes" if rt.get("available", False) else "No"
-
-                result += (
-                    f"| {rt_id} | {name} | {dev_name} | {is_default} | {is_active} |\n"
-                )
+            logger.info("Returning raw JSON for %s", object_name)
+            return get_derived(
+                object_name,
+                ("raw_json", max_fields),
+                lambda describe: _dump_describe(describe, max_fields),
+                API_VERSION,
+            )
 
-        logger.info(f"Successfully described {object_name} with direct API")
-        return result
+        return get_derived(object_name, "api_markdown", _format_describe, API_VERSION)
 
     except Exception as e:
-        logger.error(f"Error describing object {object_name} with direct API: {str(e)}")
-        return f"Error describing object {object_name} with direct API: {str(e)}"
+        logger.error("Error describing object %s with direct API: %s", object_name, e)
+        return format_error(e, f"describing object {object_name} with direct API")
+
+
+def _dump_describe(describe: Mapping[str, Any], max_fields: int) -> str:
+    """Serialize a describe as indented JSON, truncating its fields to max_fields."""
+    total_fields = len(describe.get("fields", []))
+    if 0 < max_fields < total_fields:
+        logger.info(
+            "Truncating raw JSON for %s to %s of %s fields",
+            describe.get("name"),
+            max_fields,
+            total_fields,
+        )
+        return json_dumps(
+            dict(
+                describe,
+                fields=describe["fields"][:max_fields],
+                _truncated=True,
+                _total_fields=total_fields,
+            ),
+            indent=True,
+        )
+    # The cached describe is a read-only mapping, which the encoders do not accept
+    return json_dumps(dict(describe), indent=True)
+
+
+def _format_describe(describe: Mapping[str, Any]) -> str:
+    """Format a full describe result as markdown."""
+    result = "".join(_iter_describe(describe))
+    logger.info("Successfully described %s with direct API", describe["name"])
+    return result
+
+
+def _iter_describe(describe: Mapping[str, Any]) -> Iterator[str]:
+    """Yield the markdown for a full describe result in chunks."""
+    # Format basic object information
+    yield f"## {describe['label']} ({describe['name']})\n\n"
+    yield f"**Type:** {'Custom Object' if describe.get('custom', False) else 'Standard Object'}\n"
+    yield f"**API Name:** {describe['name']}\n"
+    yield f"**Label:** {describe['label']}\n"
+    yield f"**Plural Label:** {describe.get('labelPlural', 'N/A')}\n"
+    yield f"**Key Prefix:** {describe.get('keyPrefix', 'N/A')}\n"
+
+    # Add all object properties
+    yield "\n## Object Properties\n\n"
+    yield "| Property | Value |\n"
+    yield "|----------|-------|\n"
+
+    # Include all boolean properties from the raw describe
+    yield "".join(
+        [
+            _PROPERTY_ROW % (prop, describe[prop])
+            for prop in sorted(p for p in describe if isinstance(describe[p], bool))
+        ]
+    )
+
+    # Add fields section
+    if "fields" in describe:
+        yield "\n## Fields\n\n"
+        rows, reference_fields, picklist_fields = format_fields_table(
+            describe["fields"]
+        )
+        yield from rows
+
+        # Add reference fields section if there are any
+        if reference_fields:
+            yield from format_reference_table(reference_fields)
+
+        # Add picklist fields section if there are any
+        if picklist_fields:
+            yield from format_picklist_sections(picklist_fields, include_active=True)
+
+    # Include child relationships
+    if "childRelationships" in describe and describe["childRelationships"]:
+        yield "\n## Child Relationships\n\n"
+        yield "| Child Object | Relationship Name | Field | Cascade Delete |\n"
+        yield "|-------------|------------------|-------|---------------|\n"
+
+        yield "".join(
+            [
+                _CHILD_ROW
+                % (
+                    rel.get("childSObject", "N/A"),
+                    rel.get("relationshipName") or "N/A",
+                    rel.get("field", "N/A"),
+                    "Yes" if rel.get("cascadeDelete", False) else "No",
+                )
+                for rel in describe["childRelationships"]
+            ]
+        )
+
+    # Include record types if present
+    if "recordTypeInfos" in describe and describe["recordTypeInfos"]:
+        yield "\n## Record Types\n\n"
+        yield "| Record Type ID | Name | Developer Name | Default | Active |\n"
+        yield "|---------------|------|----------------|---------|--------|\n"
+
+        yield "".join(
+            [
+                _RECORD_TYPE_ROW
+                % (
+                    rt.get("recordTypeId", "N/A"),
+                    rt.get("name", "N/A"),
+                    rt.get("developerName", "N/A"),
+                    "Yes" if rt.get("defaultRecordTypeMapping", False) else "No",
+                    "Yes" if rt.get("available", False) else "No",
+                )
+                for rt in describe["recordTypeInfos"]
+            ]
+        )
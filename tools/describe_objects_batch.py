@@ -0,0 +1,177 @@
+"""
+Describe several Salesforce objects in a single round trip
+
+This module provides functionality to retrieve describe metadata for many
+Salesforce objects at once using the Composite Batch API. Up to 25 describe
+subrequests are packed into each batch request, so describing 10 objects
+costs one HTTP round trip instead of 10.
+
+Functions:
+- fetch_describes_batch: Retrieves raw describe results for a list of objects
+- describe_objects_batch: Retrieves and formats describe results as markdown
+
+This is useful when an LLM needs to understand several related objects
+(e.g. Account, Contact, Opportunity) before answering a question.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from sf_connection import get_connection, request_json, format_error
+from .describe_object import format_object_describe
+from ._describe_cache import peek_describe, put_describe
+import logging
+
+if TYPE_CHECKING:
+    from simple_salesforce import Salesforce
+
+# Configure logging
+logger = logging.getLogger("sf_mcp_server.describe_objects_batch")
+
+# Salesforce allows at most 25 subrequests per composite batch request
+BATCH_SIZE = 25
+
+# Batch requests sent at the same time when more than 25 objects are described
+MAX_CONCURRENT_BATCHES = 4
+
+
+def fetch_describes_batch(
+    object_names: List[str],
+) -> Tuple[Dict[str, dict], Dict[str, str]]:
+    """
+    Get raw describe results for several Salesforce objects using composite/batch.
+
+    Object names are de-duplicated (preserving order). Objects already in the
+    shared describe cache are taken from it; the rest are split into chunks of
+    25, each sent as a single composite batch request, with up to
+    MAX_CONCURRENT_BATCHES requests in flight. Successful results are stored
+    in the shared describe cache.
+
+    Args:
+        object_names: API names of the objects (e.g., ['Account', 'Contact'])
+
+    Returns:
+        Tuple of (describes, errors) where describes maps object name to its
+        describe result and errors maps object name to an error message
+
+    Examples:
+        describes, errors = fetch_describes_batch(["Account", "Contact", "Lead"])
+    """
+    sf = get_connection()
+    names = list(dict.fromkeys(object_names))
+    describes = {}
+    errors = {}
+
+    # Objects already in the describe cache need no request at all
+    cached = {name: peek_describe(name) for name in names}
+    missing = [name for name in names if cached[name] is None]
+    chunks = [
+        missing[start : start + BATCH_SIZE]
+        for start in range(0, len(missing), BATCH_SIZE)
+    ]
+
+    # Batches are independent, so more than one is sent concurrently
+    if len(chunks) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(chunks), MAX_CONCURRENT_BATCHES)
+        ) as pool:
+            results = list(pool.map(lambda chunk: _send_batch(sf, chunk), chunks))
+    else:
+        results = [_send_batch(sf, chunk) for chunk in chunks]
+
+    fetched = {}
+    for chunk_describes, chunk_errors in results:
+        fetched.update(chunk_describes)
+        errors.update(chunk_errors)
+
+    # Keep the requested order
+    for name in names:
+        describe = cached[name] or fetched.get(name)
+        if describe is not None:
+            describes[name] = describe
+    errors = {name: errors[name] for name in names if name in errors}
+
+    logger.info(
+        "Batch describe returned %s results (%s cached) and %s errors",
+        len(describes),
+        len(names) - len(missing),
+        len(errors),
+    )
+    return describes, errors
+
+
+def _send_batch(
+    sf: "Salesforce", chunk: List[str]
+) -> Tuple[Dict[str, dict], Dict[str, str]]:
+    """Describe up to BATCH_SIZE objects with one composite batch request."""
+    describes = {}
+    errors = {}
+    logger.debug("Sending composite batch describe for %s", chunk)
+    payload = {
+        "batchRequests": [
+            {"method": "GET", "url": f"v{sf.sf_version}/sobjects/{name}/describe"}
+            for name in chunk
+        ]
+    }
+    response = request_json(sf, "POST", "composite/batch", json=payload)
+    # Subresults carry no Last-Modified; the describes are current as of now
+    fetched_at = formatdate(usegmt=True)
+
+    for name, sub_result in zip(chunk, response.get("results", [])):
+        if sub_result.get("statusCode") == 200:
+            describes[name] = sub_result["result"]
+            put_describe(name, describes[name], last_modified=fetched_at)
+        else:
+            # Error results are a list of {errorCode, message} entries
+            messages = sub_result.get("result") or []
+            errors[name] = (
+                "; ".join(
+                    f"{m.get('errorCode', 'ERROR')}: {m.get('message', '')}"
+                    for m in messages
+                )
+                or f"HTTP {sub_result.get('statusCode')}"
+            )
+    return describes, errors
+
+
+def describe_objects_batch(
+    object_names: List[str], include_field_details: bool = True
+) -> str:
+    """
+    Get detailed schema information for several Salesforce objects at once.
+
+    Results use the same markdown format as describe_object, one section per
+    object, followed by any objects that could not be described.
+
+    Args:
+        object_names: API names of the objects (e.g., ['Account', 'Contact'])
+        include_field_details: Whether to include detailed field information (default: True)
+
+    Returns:
+        Formatted markdown text with schema details for each object
+
+    Examples:
+        # Describe the core sales objects in one call
+        describe_objects_batch(["Account", "Contact", "Opportunity"])
+    """
+    logger.info("Batch describing Salesforce objects: %s", object_names)
+
+    try:
+        describes, errors = fetch_describes_batch(object_names)
+
+        sections = [
+            format_object_describe(describes[name], include_field_details)
+            for name in dict.fromkeys(object_names)
+            if name in describes
+        ]
+        if errors:
+            error_lines = "\n".join(
+                f"- {name}: {message}" for name, message in errors.items()
+            )
+            sections.append(f"## Errors\n\n{error_lines}\n")
+
+        return "\n".join(sections)
+
+    except Exception as e:
+        logger.error("Error batch describing objects %s: %s", object_names, e)
+        return format_error(e, f"batch describing objects {object_names}")
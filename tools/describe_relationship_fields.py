@@ -14,12 +14,17 @@ The results include:
 This is useful for understanding object dependencies and data model architecture.
 """
 
-from sf_connection import get_connection
+from sf_connection import format_error
+from ._describe_cache import get_describe
 import logging
 
 # Configure logging
 logger = logging.getLogger("sf_mcp_server.describe_relationship_fields")
 
+# Table row templates, %-formatted for each relationship
+_PARENT_ROW = "| %s | %s | %s | %s | %s |\n"
+_CHILD_ROW = "| %s | %s | %s | %s |\n"
+
 
 def describe_relationship_fields(object_name: str) -> str:
     """
@@ -55,13 +60,11 @@ def describe_relationship_fields(object_name: str) -> str:
         # Get relationships for a custom object
         describe_relationship_fields("Custom_Object__c")
     """
-    logger.info(f"Describing relationship fields for object: {object_name}")
-    sf = get_connection()
-
+    logger.info("Describing relationship fields for object: %s", object_name)
     try:
         # Get object describe info
-        logger.debug(f"Retrieving object describe for {object_name}")
-        describe = sf.__getattr__(object_name).describe()
+        logger.debug("Retrieving object describe for %s", object_name)
+        describe = get_describe(object_name)
 
         # Filter for reference fields (lookups and master-detail relationships)
         reference_fields = [
@@ -69,65 +72,74 @@ def describe_relationship_fields(object_name: str) -> str:
             for f in describe["fields"]
             if f["type"] == "reference" and f.get("referenceTo")
         ]
-        logger.debug(f"Found {len(reference_fields)} parent relationship fields")
+        logger.debug("Found %s parent relationship fields", len(reference_fields))
 
         # Get child relationships (other objects that reference this one)
         child_relationships = describe.get("childRelationships", [])
-        logger.debug(f"Found {len(child_relationships)} child relationships")
+        logger.debug("Found %s child relationships", len(child_relationships))
 
         # Prepare the markdown output
-        result = (
+        parts = [
             f"# Relationship Fields for {describe['label']} ({describe['name']})\n\n"
-        )
+        ]
 
         # Format parent relationships section
         if reference_fields:
-            result += "## Lookup/Master-Detail Fields (Parent Relationships)\n\n"
-            result += (
+            parts.append("## Lookup/Master-Detail Fields (Parent Relationships)\n\n")
+            parts.append(
                 "| API Name | Field Label | Related To | Relationship Name | Type |\n"
             )
-            result += (
+            parts.append(
                 "|----------|------------|-----------|------------------|------|\n"
             )
 
-            for field in reference_fields:
-                # Join multiple reference targets if a polymorphic lookup
-                related_to = ", ".join(field["referenceTo"])
-                rel_name = field.get("relationshipName", "N/A")
-
-                # Determine relationship type based on nillable status
-                # Non-nillable fields are master-detail relationships
-                rel_type = "Master-Detail" if not field["nillable"] else "Lookup"
-
-                result += f"| {field['name']} | {field['label']} | {related_to} | {rel_name} | {rel_type} |\n"
+            # Polymorphic lookups list all their reference targets, and
+            # non-nillable fields are master-detail relationships
+            parts.extend(
+                [
+                    _PARENT_ROW
+                    % (
+                        field["name"],
+                        field["label"],
+                        ", ".join(field["referenceTo"]),
+                        field.get("relationshipName", "N/A"),
+                        "Master-Detail" if not field["nillable"] else "Lookup",
+                    )
+                    for field in reference_fields
+                ]
+            )
         else:
-            result += "No parent relationship fields found.\n\n"
+            parts.append("No parent relationship fields found.\n\n")
 
         # Format child relationships section
         if child_relationships:
-            result += "\n## Child Relationships\n\n"
-            result += (
+            parts.append("\n## Child Relationships\n\n")
+            parts.append(
                 "| Child Object | Relationship Name | Field Name | Cascade Delete |\n"
             )
-            result += "|-------------|------------------|-----------|---------------|\n"
-
-            for rel in child_relationships:
-                # Some child relationships may not have relationship names (system relationships)
-                rel_name = (
-                    rel.get("relationshipName", "N/A")
-                    if rel.get("relationshipName")
-                    else "N/A"
-                )
-                cascade = "Yes" if rel.get("cascadeDelete", False) else "No"
-                result += f"| {rel['childSObject']} | {rel_name} | {rel['field']} | {cascade} |\n"
+            parts.append(
+                "|-------------|------------------|-----------|---------------|\n"
+            )
+
+            # Some child relationships may not have relationship names (system relationships)
+            parts.extend(
+                [
+                    _CHILD_ROW
+                    % (
+                        rel["childSObject"],
+                        rel.get("relationshipName") or "N/A",
+                        rel["field"],
+                        "Yes" if rel.get("cascadeDelete", False) else "No",
+                    )
+                    for rel in child_relationships
+                ]
+            )
         else:
-            result += "\nNo child relationships found.\n"
+            parts.append("\nNo child relationships found.\n")
 
-        logger.info(f"Successfully described relationships for {object_name}")
-        return result
+        logger.info("Successfully described relationships for %s", object_name)
+        return "".join(parts)
 
     except Exception as e:
-        logger.error(
-            f"Error describing relationship fields for {object_name}: {str(e)}"
-        )
-        return f"Error describing relationship fields for {object_name}: {str(e)}"
+        logger.error("Error describing relationship fields for %s: %s", object_name, e)
+        return format_error(e, f"describing relationship fields for {object_name}")
@@ -9,14 +9,66 @@ with optional filtering by field type. This is useful for:
 
 The results include field API names, labels, types, and other important attributes
 presented in a clear markdown table format.
+
+Fields are grouped by type once per describe, and each formatted table is
+cached with the describe, so repeated queries for the same object and type
+do not re-scan or re-format the field list.
 """
 
-from sf_connection import get_connection
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, List, Optional
+from sf_connection import format_error
+from ._describe_cache import get_derived
+from ._markdown import CELL_ESCAPES
 import logging
 
 # Configure logging
 logger = logging.getLogger("sf_mcp_server.get_fields_by_type")
 
+# Table row template, %-formatted for each field
+_FIELD_ROW = "| %s | %s | %s | %s | %s | %s | %s |\n"
+
+# Describe field properties read into each FieldSummary, in one C-level call
+_FIELD_PROPERTIES = itemgetter(
+    "name", "label", "type", "nillable", "updateable", "custom"
+)
+
+
+@dataclass(slots=True, frozen=True)
+class FieldSummary:
+    """
+    The properties of a describe field shown in the fields table.
+
+    Built once per describe; slots keep objects with hundreds of fields compact.
+    """
+
+    name: str
+    label: str
+    type: str
+    required: bool
+    updateable: bool
+    custom: bool
+    description: Optional[str]
+
+    @classmethod
+    def from_describe(cls, field: Dict[str, Any]) -> "FieldSummary":
+        """Create a summary from a raw describe field."""
+        description = field.get("inlineHelpText", "")
+        if description:
+            # Remove newlines and escape pipe characters that would break markdown tables
+            description = description.translate(CELL_ESCAPES)
+        name, label, field_type, nillable, updateable, custom = _FIELD_PROPERTIES(field)
+        return cls(
+            name=name,
+            label=label,
+            type=field_type,
+            required=not nillable,
+            updateable=updateable,
+            custom=custom,
+            description=description,
+        )
+
 
 def get_fields_by_type(object_name: str, field_type: str = None) -> str:
     """
@@ -58,64 +110,95 @@ def get_fields_by_type(object_name: str, field_type: str = None) -> str:
         # Get all lookup/master-detail fields for a custom object
         get_fields_by_type("Custom_Object__c", "reference")
     """
-    logger.info(
-        f"Getting fields for object {object_name}"
-        + (f" of type {field_type}" if field_type else "")
-    )
+    if field_type:
+        logger.info("Getting fields for object %s of type %s", object_name, field_type)
+    else:
+        logger.info("Getting fields for object %s", object_name)
 
-    sf = get_connection()
+    type_key = field_type.lower() if field_type else ""
 
     try:
-        # Get object describe info
-        logger.debug(f"Retrieving object describe for {object_name}")
-        describe = sf.__getattr__(object_name).describe()
-        fields = describe["fields"]
-        logger.debug(f"Retrieved {len(fields)} fields for {object_name}")
-
-        # Filter by type if specified
-        if field_type:
-            logger.debug(f"Filtering fields by type: {field_type}")
-            fields = [f for f in fields if f["type"].lower() == field_type.lower()]
-            logger.debug(f"Found {len(fields)} fields of type {field_type}")
-
-            if not fields:
-                logger.info(
-                    f"No fields of type '{field_type}' found on object '{object_name}'"
-                )
-                return (
-                    f"No fields of type '{field_type}' found on object '{object_name}'."
-                )
-
-        # Format results as a markdown table
-        if field_type:
-            result = f"# {field_type.capitalize()} Fields on {describe['label']} ({describe['name']})\n\n"
-        else:
-            result = f"# All Fields on {describe['label']} ({describe['name']})\n\n"
-
-        result += "| API Name | Label | Type | Required | Updateable | Custom | Description |\n"
-        result += "|----------|-------|------|----------|------------|--------|-------------|\n"
-
-        # Sort fields by name for consistent output
-        fields.sort(key=lambda f: f["name"])
-
-        for field in fields:
-            # Format boolean properties as Yes/No for readability
-            required = "Yes" if not field["nillable"] else "No"
-            updateable = "Yes" if field["updateable"] else "No"
-            custom = "Yes" if field["custom"] else "No"
-
-            # Clean up description text for table formatting
-            description = field.get("inlineHelpText", "")
-            if description:
-                # Remove newlines and escape pipe characters that would break markdown tables
-                description = description.replace("\n", " ").replace("|", "\\|")
-
-            # Add field to table
-            result += f"| {field['name']} | {field['label']} | {field['type']} | {required} | {updateable} | {custom} | {description} |\n"
-
-        logger.info(f"Successfully returned {len(fields)} fields for {object_name}")
+        fields_by_type = get_derived(
+            object_name, "fields_by_type", _group_fields_by_type
+        )
+
+        if type_key and type_key not in fields_by_type:
+            logger.info(
+                "No fields of type '%s' found on object '%s'", field_type, object_name
+            )
+            return f"No fields of type '{field_type}' found on object '{object_name}'."
+
+        result = get_derived(
+            object_name,
+            ("fields_by_type_table", type_key),
+            lambda describe: _format_fields_table(
+                describe, fields_by_type[type_key], field_type
+            ),
+        )
+
+        logger.info(
+            "Successfully returned %s fields for %s",
+            len(fields_by_type[type_key]),
+            object_name,
+        )
         return result
 
     except Exception as e:
-        logger.error(f"Error getting fields for {object_name}: {str(e)}")
-        return f"Error getting fields for {object_name}: {str(e)}"
+        logger.error("Error getting fields for %s: %s", object_name, e)
+        return format_error(e, f"getting fields for {object_name}")
+
+
+def _group_fields_by_type(
+    describe: Dict[str, Any],
+) -> Dict[str, List[FieldSummary]]:
+    """
+    Group an object's fields by lowercase type, each group sorted by API name.
+
+    The empty-string key holds all fields.
+    """
+    fields = sorted(
+        (FieldSummary.from_describe(f) for f in describe["fields"]),
+        key=attrgetter("name"),
+    )
+    groups = {"": fields}
+    for field in fields:
+        groups.setdefault(field.type.lower(), []).append(field)
+    return groups
+
+
+def _format_fields_table(
+    describe: Dict[str, Any], fields: List[FieldSummary], field_type: str = None
+) -> str:
+    """Format fields of an object as a markdown table."""
+    if field_type:
+        parts = [
+            f"# {field_type.capitalize()} Fields on {describe['label']} ({describe['name']})\n\n"
+        ]
+    else:
+        parts = [f"# All Fields on {describe['label']} ({describe['name']})\n\n"]
+
+    parts.append(
+        "| API Name | Label | Type | Required | Updateable | Custom | Description |\n"
+    )
+    parts.append(
+        "|----------|-------|------|----------|------------|--------|-------------|\n"
+    )
+
+    # Format boolean properties as Yes/No for readability
+    parts.extend(
+        [
+            _FIELD_ROW
+            % (
+                field.name,
+                field.label,
+                field.type,
+                "Yes" if field.required else "No",
+                "Yes" if field.updateable else "No",
+                "Yes" if field.custom else "No",
+                field.description,
+            )
+            for field in fields
+        ]
+    )
+
+    return "".join(parts)
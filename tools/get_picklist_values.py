@@ -12,12 +12,19 @@ This is useful for understanding all possible values for dropdown fields in Sale
 objects and for building integration validation logic.
 """
 
-from sf_connection import get_connection
+from typing import Any, Dict, Mapping
+from sf_connection import format_error
+from ._describe_cache import get_derived
+from ._describe_format import PICKLIST_TYPES
+from ._markdown import escape_cell
 import logging
 
 # Configure logging
 logger = logging.getLogger("sf_mcp_server.get_picklist_values")
 
+# Table row template, %-formatted for each picklist value
+_PICKLIST_ROW = "| %s | %s | %s | %s |\n"
+
 
 def get_picklist_values(object_name: str, field_name: str) -> str:
     """
@@ -44,58 +51,68 @@ def get_picklist_values(object_name: str, field_name: str) -> str:
         # Get picklist options for a custom field
         get_picklist_values("Custom_Object__c", "Custom_Picklist_Field__c")
     """
-    logger.info(f"Getting picklist values for {object_name}.{field_name}")
-    sf = get_connection()
-
+    logger.info("Getting picklist values for %s.%s", object_name, field_name)
     try:
-        # Get object describe info
-        logger.debug(f"Retrieving object describe for {object_name}")
-        describe = sf.__getattr__(object_name).describe()
-
-        # Find the specific field
-        field = next((f for f in describe["fields"] if f["name"] == field_name), None)
+        # Find the specific field in the object's cached describe
+        logger.debug("Retrieving object describe for %s", object_name)
+        field = get_derived(object_name, "fields_by_name", _fields_by_name).get(
+            field_name
+        )
 
         # Handle field not found
         if not field:
-            logger.warning(f"Field '{field_name}' not found on object '{object_name}'")
+            logger.warning(
+                "Field '%s' not found on object '%s'", field_name, object_name
+            )
             return f"Field '{field_name}' not found on object '{object_name}'."
 
         # Verify that the field is a picklist type
-        if field["type"] not in ("picklist", "multipicklist"):
+        if field["type"] not in PICKLIST_TYPES:
             logger.warning(
-                f"Field '{field_name}' is not a picklist (type: {field['type']})"
+                "Field '%s' is not a picklist (type: %s)", field_name, field["type"]
             )
             return (
                 f"Field '{field_name}' is not a picklist field (type: {field['type']})."
             )
 
-        # Format results as a markdown table
-        result = (
-            f"Picklist values for {object_name}.{field_name} ({field['label']}):\n\n"
+        # Format results as a markdown table, escaping any pipe characters
+        # that might break table formatting
+        picklist_values = field.get("picklistValues", [])
+        result = "".join(
+            [
+                f"Picklist values for {object_name}.{field_name} ({field['label']}):\n\n",
+                "| Value | Label | Default | Active |\n",
+                "|-------|-------|---------|--------|\n",
+            ]
+            + [
+                _PICKLIST_ROW
+                % (
+                    escape_cell(value["value"]),
+                    escape_cell(value["label"]),
+                    "Yes" if value.get("defaultValue", False) else "No",
+                    "Yes" if value.get("active", True) else "No",
+                )
+                for value in picklist_values
+            ]
         )
-        result += "| Value | Label | Default | Active |\n"
-        result += "|-------|-------|---------|--------|\n"
-
-        # Add each picklist value as a row in the table
-        for value in field.get("picklistValues", []):
-            # Format boolean properties as Yes/No for readability
-            is_default = "Yes" if value.get("defaultValue", False) else "No"
-            is_active = "Yes" if value.get("active", True) else "No"
-
-            # Escape any pipe characters that might break table formatting
-            val = str(value["value"]).replace("|", "\\|")
-            label = str(value["label"]).replace("|", "\\|")
-
-            # Add row to table
-            result += f"| {val} | {label} | {is_default} | {is_active} |\n"
 
         logger.info(
-            f"Retrieved {len(field.get('picklistValues', []))} picklist values for {object_name}.{field_name}"
+            "Retrieved %s picklist values for %s.%s",
+            len(picklist_values),
+            object_name,
+            field_name,
         )
         return result
 
     except Exception as e:
         logger.error(
-            f"Error getting picklist values for {object_name}.{field_name}: {str(e)}"
+            "Error getting picklist values for %s.%s: %s", object_name, field_name, e
         )
-        return f"Error getting picklist values for {object_name}.{field_name}: {str(e)}"
+        return format_error(
+            e, f"getting picklist values for {object_name}.{field_name}"
+        )
+
+
+def _fields_by_name(describe: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Index the fields of a describe by API name."""
+    return {field["name"]: field for field in describe["fields"]}
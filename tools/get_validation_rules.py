@@ -16,12 +16,29 @@ The tool returns details such as:
 - Rule descriptions
 """
 
-from sf_connection import get_connection
+from typing import Optional
+from sf_connection import get_connection, format_error, json_loads, soql_quote
+from ._markdown import CELL_ESCAPES
 import logging
 
 # Configure logging
 logger = logging.getLogger("sf_mcp_server.validation_rules")
 
+# Table row template, %-formatted for each rule
+_RULE_ROW = "| %s | %s | %s | %s | %s |\n"
+
+# Descriptions longer than this are truncated in the table
+_MAX_DESCRIPTION = 100
+
+# Tooling API query for the validation rules of one object, by quoted API name
+_VALIDATION_RULES_SOQL = (
+    "SELECT Id, ValidationName, Active, Description, "
+    "EntityDefinition.DeveloperName, ErrorDisplayField, ErrorMessage "
+    "FROM ValidationRule "
+    "WHERE EntityDefinition.DeveloperName = %s "
+    "ORDER BY ValidationName"
+)
+
 
 def get_validation_rules(object_name: str) -> str:
     """
@@ -44,84 +61,72 @@ def get_validation_rules(object_name: str) -> str:
         # Get validation rules for a custom object
         get_validation_rules("Custom_Object__c")
     """
-    logger.info(f"Retrieving validation rules for object: {object_name}")
+    logger.info("Retrieving validation rules for object: %s", object_name)
     sf = get_connection()
 
     try:
-        # Extract the instance URL from the base_url (which includes API version path)
-        instance_url = sf.base_url.split("/services/data")[0]
+        instance_url = f"https://{sf.sf_instance}"
 
         # Construct the Tooling API query URL
         url = f"{instance_url}/services/data/v63.0/tooling/query/"
 
-        # Build SOQL query to retrieve validation rules
-        # This query gets key details about validation rules for the specified object
-        soql = f"""
-            SELECT Id, ValidationName, Active, Description, 
-                   EntityDefinition.DeveloperName, ErrorDisplayField, 
-                   ErrorMessage 
-            FROM ValidationRule 
-            WHERE EntityDefinition.DeveloperName='{object_name}'
-            ORDER BY ValidationName
-        """
+        # Build SOQL query to retrieve validation rules; the query text only
+        # varies by the quoted object name
+        soql = _VALIDATION_RULES_SOQL % soql_quote(object_name)
 
         # Set up request headers using the Salesforce session
         headers = sf.headers
         params = {"q": soql}
 
         # Execute the Tooling API request
-        logger.debug(f"Executing SOQL query for validation rules: {soql}")
+        logger.debug("Executing SOQL query for validation rules: %s", soql)
         response = sf.session.get(url, headers=headers, params=params)
         response.raise_for_status()
-        result = response.json()
+        result = json_loads(response.content)
 
         # Handle case where no validation rules exist
         if not result.get("records"):
-            logger.info(f"No validation rules found for {object_name}")
+            logger.info("No validation rules found for %s", object_name)
             return f"No validation rules found for {object_name}."
 
         # Format results as a markdown table
         logger.info(
-            f"Found {len(result['records'])} validation rules for {object_name}"
+            "Found %s validation rules for %s", len(result["records"]), object_name
         )
-        output = (
-            f"Found {len(result['records'])} validation rules for {object_name}:\n\n"
+        output = [
+            f"Found {len(result['records'])} validation rules for {object_name}:\n\n",
+            # Create table header
+            "| Name | Active | Error Message | Error Field | Description |\n",
+            "|------|--------|--------------|------------|-------------|\n",
+        ]
+
+        # Add each validation rule as a row in the table; missing texts show
+        # as N/A and long descriptions are truncated for readability
+        output.extend(
+            [
+                _RULE_ROW
+                % (
+                    rule.get("ValidationName", "N/A"),
+                    "Yes" if rule.get("Active", False) else "No",
+                    _text_cell(rule.get("ErrorMessage", "")),
+                    rule.get("ErrorDisplayField", "N/A"),
+                    _text_cell(rule.get("Description", ""), _MAX_DESCRIPTION),
+                )
+                for rule in result["records"]
+            ]
         )
 
-        # Create table header
-        output += "| Name | Active | Error Message | Error Field | Description |\n"
-        output += "|------|--------|--------------|------------|-------------|\n"
-
-        # Add each validation rule as a row in the table
-        for rule in result["records"]:
-            # Format the active status as Yes/No
-            active = "Yes" if rule.get("Active", False) else "No"
-
-            # Get error display field or default to N/A
-            error_field = rule.get("ErrorDisplayField", "N/A")
+        return "".join(output)
 
-            # Handle None values safely with default empty strings
-            # Also escape pipe characters to prevent breaking markdown tables
-            error_message = rule.get("ErrorMessage", "")
-            if error_message is not None:
-                error_message = error_message.replace("\n", " ").replace("|", "\\|")
-            else:
-                error_message = "N/A"
-
-            description = rule.get("Description", "")
-            if description is not None:
-                # Truncate very long descriptions for readability in table
-                if len(description) > 100:
-                    description = description[:97] + "..."
-                description = description.replace("\n", " ").replace("|", "\\|")
-            else:
-                description = "N/A"
-
-            # Add the rule details to the output table
-            output += f"| {rule.get('ValidationName', 'N/A')} | {active} | {error_message} | {error_field} | {description} |\n"
+    except Exception as e:
+        logger.error("Error retrieving validation rules: %s", e)
+        return format_error(e, "retrieving validation rules")
 
-        return output
 
-    except Exception as e:
-        logger.error(f"Error retrieving validation rules: {str(e)}")
-        return f"Error retrieving validation rules: {str(e)}"
+def _text_cell(text: Optional[str], max_length: int = 0) -> str:
+    """Format free text for a table cell, truncating it past max_length if set."""
+    if text is None:
+        return "N/A"
+    if max_length and len(text) > max_length:
+        text = text[: max_length - 3] + "..."
+    return text.translate(CELL_ESCAPES)
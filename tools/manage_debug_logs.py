@@ -24,15 +24,101 @@ Log levels (increasing detail):
 - FINEST: Finest and all higher events (most detailed)
 """
 
-from typing import Dict, List, Any, Optional
-from sf_connection import get_connection
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Union
+from sf_connection import (
+    DESCRIBE_CACHE_DIR,
+    get_connection,
+    format_error,
+    json_loads,
+    soql_quote,
+    soql_quote_like,
+)
 import datetime
 import logging
-import json
+import os
+import re
+import stat
+import tempfile
+import time
+from urllib.parse import urlencode
+
+if TYPE_CHECKING:
+    import requests
+    from simple_salesforce import Salesforce
 
 # Configure logging
 logger = logging.getLogger("sf_mcp_server.debug_logs")
 
+# REST API version and path prefix for all debug log requests
+_API_VERSION = "v63.0"
+_API_PATH = f"/services/data/{_API_VERSION}"
+_TOOLING_SOBJECTS_PATH = f"{_API_PATH}/tooling/sobjects"
+
+# Most subrequests Salesforce accepts in one composite batch
+_BATCH_SIZE = 25
+
+# Salesforce reports a TraceFlag create for a user that already has an active
+# one as DUPLICATE_VALUE, or as FIELD_INTEGRITY_EXCEPTION with this message;
+# that code also covers unrelated errors such as an invalid DebugLevel or date
+_TRACED_ERROR_CODE = "DUPLICATE_VALUE"
+_TRACED_MESSAGE = re.compile(r"\balready (?:being )?traced\b", re.IGNORECASE)
+
+# DebugLevel Ids by (instance, log level); DebugLevels rarely change, so
+# enabling logs again skips looking one up
+_DEBUG_LEVEL_IDS: Dict[Tuple[str, str], str] = {}
+
+# Resolved User records by (instance, lowercase username or name), with their
+# expiry time; users rarely change, so repeated calls skip the user lookup
+_USER_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_USER_CACHE_TTL = 300
+_USER_CACHE_SIZE = 1024
+
+# Log bodies larger than this many bytes are saved to a file and only their
+# start is returned inline; bodies are streamed in chunks of _LOG_CHUNK_SIZE
+_MAX_INLINE_LOG_BODY = 1_000_000
+_LOG_CHUNK_SIZE = 64 * 1024
+
+# Large log bodies are saved as <log id>.log in a private (0700) directory
+# next to the describe cache and reused on the next retrieve (a log's body
+# never changes); only the newest _MAX_SAVED_LOGS are kept. Log bodies can
+# hold personal data, so nothing is saved when the describe cache directory
+# is disabled.
+_LOG_DIR = (
+    os.path.join(os.path.dirname(DESCRIBE_CACHE_DIR.rstrip(os.sep)), "apex-logs")
+    if DESCRIBE_CACHE_DIR
+    else ""
+)
+_MAX_SAVED_LOGS = 20
+_LOG_ID = re.compile(r"\w+", re.ASCII)
+
+# SOQL templates, %-formatted with soql_quote()d values so the query text
+# is built once per module and user input cannot change the query
+_USER_FIELDS = "SELECT Id, Username, Name, IsActive FROM User"
+# One lookup for both exact and fuzzy matches; the exact Username match is
+# picked client-side, so the window is wider than the matches ever listed
+_USER_BY_USERNAME_SOQL = _USER_FIELDS + " WHERE Username = %s"
+_USER_LOOKUP_SOQL = (
+    _USER_FIELDS
+    + " WHERE Name LIKE %s OR Username LIKE %s"
+    + " ORDER BY LastModifiedDate DESC LIMIT 200"
+)
+# Most candidate users listed when a lookup is ambiguous
+_MAX_USER_MATCHES = 5
+
+_ACTIVE_TRACE_FLAGS_SOQL = (
+    "SELECT Id, ExpirationDate FROM TraceFlag"
+    " WHERE TracedEntityId = %s AND ExpirationDate > %s"
+)
+_DEBUG_LEVEL_SOQL = "SELECT Id FROM DebugLevel WHERE ApexCode = %s"
+_APEX_LOG_FIELDS = (
+    "SELECT Id, LogUserId, Operation, Application, Status, LogLength,"
+    " LastModifiedDate FROM ApexLog"
+)
+_APEX_LOG_BY_ID_SOQL = _APEX_LOG_FIELDS + " WHERE Id = %s"
+_APEX_LOGS_BY_USER_SOQL = (
+    _APEX_LOG_FIELDS + " WHERE LogUserId = %s ORDER BY LastModifiedDate DESC LIMIT %d"
+)
+
 
 def manage_debug_logs(
     operation: str,
@@ -85,422 +171,439 @@ def manage_debug_logs(
         if operation == "enable" and not log_level:
             return "Error: Log level is required for 'enable' operation. Valid options: NONE, ERROR, WARN, INFO, DEBUG, FINE, FINER, FINEST"
 
+        if operation not in _OPERATIONS:
+            return f"Invalid operation: '{operation}'. Must be one of: {', '.join(_OPERATIONS)}"
+
         # Get connection to Salesforce
         sf = get_connection()
 
-        # Extract instance URL for direct API calls
-        instance_url = sf.base_url.split("/services/data")[0]
-        headers = sf.headers
-
-        # Determine if the input is likely a username or a full name
-        is_likely_username = "@" in username or " " not in username
-
-        # Build the query based on whether the input looks like a username or a full name
-        if is_likely_username:
-            # Query by username
-            soql = f"SELECT Id, Username, Name, IsActive FROM User WHERE Username = '{username}'"
-        else:
-            # Query by full name
-            soql = f"""SELECT Id, Username, Name, IsActive 
-                    FROM User 
-                    WHERE Name LIKE '%{username}%'
-                    ORDER BY LastModifiedDate DESC
-                    LIMIT 5"""
-
-        # Execute user query
-        params = {"q": soql}
-        response = sf.session.get(
-            f"{instance_url}/services/data/v63.0/query/", headers=headers, params=params
-        )
-        response.raise_for_status()
-        user_query = response.json()
-
-        if not user_query.get("records") or len(user_query["records"]) == 0:
-            # If no results with the initial query, try a more flexible search
-            soql = f"""SELECT Id, Username, Name, IsActive 
-                    FROM User 
-                    WHERE Name LIKE '%{username}%' 
-                    OR Username LIKE '%{username}%'
-                    ORDER BY LastModifiedDate DESC
-                    LIMIT 5"""
-
-            params = {"q": soql}
-            response = sf.session.get(
-                f"{instance_url}/services/data/v63.0/query/",
-                headers=headers,
-                params=params,
+        user = _resolve_user(sf, username)
+        if isinstance(user, str):
+            return user
+
+        if not user["IsActive"]:
+            return f"Warning: User '{username}' exists but is inactive. Debug logs may not be generated for inactive users."
+
+        # Handle operations
+        try:
+            return _OPERATIONS[operation](
+                sf,
+                user,
+                username,
+                log_level=log_level,
+                expiration_time=expiration_time,
+                limit=limit,
+                log_id=log_id,
+                include_body=include_body,
             )
-            response.raise_for_status()
-            user_query = response.json()
+        except Exception:
+            # The cached user may be stale (e.g., deleted); look it up again
+            _USER_CACHE.pop((sf.sf_instance, username.lower()), None)
+            raise
 
-            if not user_query.get("records") or len(user_query["records"]) == 0:
-                return f"Error: No user found matching '{username}'. Please verify the username or full name and try again."
+    except Exception as e:
+        logger.error("Error managing debug logs: %s", e)
+        return format_error(e, "managing debug logs")
 
-            # If multiple users found, ask for clarification
-            if len(user_query["records"]) > 1:
-                response_text = f"Multiple users found matching '{username}'. Please specify which user by providing the exact username:\n\n"
 
-                for user in user_query["records"]:
-                    response_text += f"- {user['Name']} ({user['Username']})\n"
+def _resolve_user(sf: "Salesforce", username: str) -> Union[Dict[str, Any], str]:
+    """
+    Find the user a username or full name refers to, cached for _USER_CACHE_TTL
+    seconds.
 
-                return response_text
+    Returns the User record, or an error message to return to the caller.
+    """
+    cache_key = (sf.sf_instance, username.lower())
+    entry = _USER_CACHE.get(cache_key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+
+    # Look up the exact username and the fuzzy matches in a single round trip;
+    # the exact match is a query of its own so the fuzzy LIMIT can't drop it
+    name_pattern = soql_quote_like(username)
+    exact_users, users = _batch_query(
+        sf,
+        [
+            _USER_BY_USERNAME_SOQL % soql_quote(username),
+            _USER_LOOKUP_SOQL % (name_pattern, name_pattern),
+        ],
+    )
+
+    # Prefer the exact username match, then a single exact full name match;
+    # otherwise the input must match a single user, so debug logs are never
+    # changed for someone the caller did not mean
+    if exact_users:
+        user = exact_users[0]
+    else:
+        if not users:
+            return f"Error: No user found matching '{username}'. Please verify the username or full name and try again."
+
+        exact_name = username.lower()
+        named = [u for u in users if (u.get("Name") or "").lower() == exact_name]
+        if len(named) == 1:
+            users = named
+
+        if len(users) > 1:
+            # If multiple users found, ask for clarification
+            response_text = f"Multiple users found matching '{username}'. Please specify which user by providing the exact username:\n\n"
 
-        user = user_query["records"][0]
+            for user in users[:_MAX_USER_MATCHES]:
+                response_text += f"- {user['Name']} ({user['Username']})\n"
 
-        if not user["IsActive"]:
-            return f"Warning: User '{username}' exists but is inactive. Debug logs may not be generated for inactive users."
+            return response_text
 
-        # Handle operations
-        if operation == "enable":
-            # Set default expiration time if not provided
-            expiration_time = expiration_time or 30
-
-            # Format datetime for SOQL: milliseconds, no quotes, Z
-            now = datetime.datetime.utcnow()
-            expiration_soql = now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-
-            # Check if a trace flag already exists for this user
-            soql = f"""
-                SELECT Id, DebugLevelId, ExpirationDate FROM TraceFlag 
-                WHERE TracedEntityId = '{user['Id']}' 
-                AND ExpirationDate > {expiration_soql}
-            """
-            # Execute trace flag query using tooling API
-            params = {"q": soql}
-            response = sf.session.get(
-                f"{instance_url}/services/data/v63.0/tooling/query/",
-                headers=headers,
-                params=params,
-            )
-            response.raise_for_status()
-            existing_trace_flag = response.json()
+        user = users[0]
 
-            # Calculate expiration date
-            expiration_date = datetime.datetime.now() + datetime.timedelta(
-                minutes=expiration_time
-            )
+    # Drop the oldest entry once the cache is full
+    if len(_USER_CACHE) >= _USER_CACHE_SIZE:
+        _USER_CACHE.pop(next(iter(_USER_CACHE)), None)
+    _USER_CACHE[cache_key] = (time.monotonic() + _USER_CACHE_TTL, user)
+    return user
 
-            # --- Find or create DebugLevel for requested log_level ---
-            # First, try to find a standard DebugLevel with the requested log level
-            soql_debug_level = (
-                f"SELECT Id FROM DebugLevel WHERE ApexCode = '{log_level}'"
-            )
-            params_debug_level = {"q": soql_debug_level}
-            response = sf.session.get(
-                f"{instance_url}/services/data/v63.0/tooling/query/",
-                headers=headers,
-                params=params_debug_level,
-            )
-            response.raise_for_status()
-            debug_level_query = response.json()
 
-            if debug_level_query.get("records"):
-                # Use existing DebugLevel
-                debug_level_id = debug_level_query["records"][0]["Id"]
-                logger.info(f"Using existing DebugLevel with ID: {debug_level_id}")
-            else:
-                # Create a new DebugLevel if none exists
-                logger.info(f"Creating new DebugLevel with log level: {log_level}")
-                debug_level_data = {
-                    "DeveloperName": log_level,
-                    "MasterLabel": log_level,
-                    "ApexCode": log_level,
-                    "ApexProfiling": log_level,
-                    "Callout": log_level,
-                    "Database": log_level,
-                    "System": log_level,
-                    "Validation": log_level,
-                    "Visualforce": log_level,
-                    "Workflow": log_level,
-                }
-                response = sf.session.post(
-                    f"{instance_url}/services/data/v63.0/tooling/sobjects/DebugLevel",
-                    headers=headers,
-                    json=debug_level_data,
-                )
-                response.raise_for_status()
-                debug_level_result = response.json()
-                debug_level_id = debug_level_result["id"]
-                logger.info(f"Created new DebugLevel with ID: {debug_level_id}")
-
-            if (
-                existing_trace_flag.get("records")
-                and len(existing_trace_flag["records"]) > 0
-            ):
-                # A trace flag already exists for this user - update it
-                trace_flag = existing_trace_flag["records"][0]
-                current_expiration = trace_flag.get("ExpirationDate")
-                # Always add 30 seconds to the current expiration and update
-                try:
-                    if current_expiration:
-                        current_exp_dt = datetime.datetime.fromisoformat(
-                            current_expiration.replace("Z", "+00:00")
-                        )
-                        new_expiration = current_exp_dt + datetime.timedelta(seconds=30)
-                    else:
-                        new_expiration = datetime.datetime.now() + datetime.timedelta(
-                            seconds=30
-                        )
-                except Exception:
-                    new_expiration = datetime.datetime.now() + datetime.timedelta(
-                        seconds=30
-                    )
-
-                # Only update ExpirationDate and DebugLevelId (NOT LogType)
-                update_data = {
-                    "ExpirationDate": new_expiration.isoformat(),
-                    "DebugLevelId": debug_level_id,
-                }
-                logger.info(
-                    f"Updating TraceFlag {trace_flag['Id']} with: {update_data}"
-                )
-                response = sf.session.patch(
-                    f"{instance_url}/services/data/v63.0/tooling/sobjects/TraceFlag/{trace_flag['Id']}",
-                    headers=headers,
-                    json=update_data,
+def _enable(
+    sf: "Salesforce",
+    user: Dict[str, Any],
+    username: str,
+    log_level: str,
+    expiration_time: Optional[int],
+    **_: Any,
+) -> str:
+    """Enable debug logs for a user, updating their active trace flag if any."""
+    sobjects_url = f"https://{sf.sf_instance}{_TOOLING_SOBJECTS_PATH}"
+    headers = sf.headers
+
+    # Set default expiration time if not provided
+    expiration_time = expiration_time or 30
+
+    # Current time in UTC, for the new trace flag's dates
+    now = datetime.datetime.now(datetime.timezone.utc)
+    expiration_date = now + datetime.timedelta(minutes=expiration_time)
+
+    # --- Find or create DebugLevel for requested log_level ---
+    # The cached Id is taken out until a trace flag is saved with it, so
+    # a deleted DebugLevel is looked up again on the next call
+    debug_level_key = (sf.sf_instance, log_level)
+    debug_level_id = _DEBUG_LEVEL_IDS.pop(debug_level_key, None)
+    if debug_level_id:
+        logger.info("Using cached DebugLevel with ID: %s", debug_level_id)
+    else:
+        # First, try to find a standard DebugLevel with the requested log level
+        debug_level_query = _query(
+            sf, _DEBUG_LEVEL_SOQL % soql_quote(log_level), tooling=True
+        )
+        if debug_level_query.get("records"):
+            # Use existing DebugLevel
+            debug_level_id = debug_level_query["records"][0]["Id"]
+            logger.info("Using existing DebugLevel with ID: %s", debug_level_id)
+
+    if not debug_level_id:
+        # Create a new DebugLevel if none exists
+        logger.info("Creating new DebugLevel with log level: %s", log_level)
+        debug_level_data = {
+            "DeveloperName": log_level,
+            "MasterLabel": log_level,
+            "ApexCode": log_level,
+            "ApexProfiling": log_level,
+            "Callout": log_level,
+            "Database": log_level,
+            "System": log_level,
+            "Validation": log_level,
+            "Visualforce": log_level,
+            "Workflow": log_level,
+        }
+        response = sf.session.post(
+            f"{sobjects_url}/DebugLevel",
+            headers=headers,
+            json=debug_level_data,
+        )
+        response.raise_for_status()
+        debug_level_result = json_loads(response.content)
+        debug_level_id = debug_level_result["id"]
+        logger.info("Created new DebugLevel with ID: %s", debug_level_id)
+
+    # Create a new trace flag; Salesforce rejects it if the user is
+    # already traced, and only then is the existing flag looked up
+    logger.info("Creating new TraceFlag for user ID: %s", user["Id"])
+    trace_flag_data = {
+        "TracedEntityId": user["Id"],
+        "DebugLevelId": debug_level_id,
+        "LogType": "USER_DEBUG",  # LogType can be set on creation
+        "StartDate": _soql_datetime(now),
+        "ExpirationDate": _soql_datetime(expiration_date),
+    }
+    response = sf.session.post(
+        f"{sobjects_url}/TraceFlag",
+        headers=headers,
+        json=trace_flag_data,
+    )
+    existing_trace_flag = {}
+    if _is_traced_conflict(response):
+        # Check if a trace flag already exists for this user
+        existing_trace_flag = _query(
+            sf,
+            _ACTIVE_TRACE_FLAGS_SOQL % (soql_quote(user["Id"]), _soql_datetime(now)),
+            tooling=True,
+        )
+
+    if existing_trace_flag.get("records"):
+        # A trace flag already exists for this user - update it
+        trace_flag = existing_trace_flag["records"][0]
+        current_expiration = trace_flag.get("ExpirationDate")
+        # Always add 30 seconds to the current expiration and update
+        try:
+            if current_expiration:
+                current_exp_dt = datetime.datetime.fromisoformat(
+                    current_expiration.replace("Z", "+00:00")
                 )
-                logger.info(f"PATCH response: {response.status_code}")
-                response.raise_for_status()
-                operation_status = "updated"
-                return f"Successfully updated debug log expiration for user '{username}'.\n\n**Log Level:** {log_level}\n**New Expiration:** {new_expiration.strftime('%Y-%m-%d %H:%M:%S')}\n**Trace Flag ID:** {trace_flag['Id']}\n"
+                new_expiration = current_exp_dt + datetime.timedelta(seconds=30)
             else:
-                # No existing trace flag - create a new one
-                logger.info(f"Creating new TraceFlag for user ID: {user['Id']}")
-                trace_flag_data = {
-                    "TracedEntityId": user["Id"],
-                    "DebugLevelId": debug_level_id,
-                    "LogType": "USER_DEBUG",  # LogType can be set on creation
-                    "StartDate": datetime.datetime.now().isoformat(),
-                    "ExpirationDate": expiration_date.isoformat(),
-                }
-                response = sf.session.post(
-                    f"{instance_url}/services/data/v63.0/tooling/sobjects/TraceFlag",
-                    headers=headers,
-                    json=trace_flag_data,
-                )
-                response.raise_for_status()
-                trace_flag_result = response.json()
-                trace_flag_id = trace_flag_result["id"]
-                operation_status = "enabled"
-                logger.info(f"Created new TraceFlag with ID: {trace_flag_id}")
+                new_expiration = now + datetime.timedelta(seconds=30)
+        except Exception:
+            new_expiration = now + datetime.timedelta(seconds=30)
+
+        # Only update ExpirationDate and DebugLevelId (NOT LogType)
+        update_data = {
+            "ExpirationDate": _soql_datetime(new_expiration),
+            "DebugLevelId": debug_level_id,
+        }
+        logger.info("Updating TraceFlag %s with: %s", trace_flag["Id"], update_data)
+        response = sf.session.patch(
+            f"{sobjects_url}/TraceFlag/{trace_flag['Id']}",
+            headers=headers,
+            json=update_data,
+        )
+        logger.info("PATCH response: %s", response.status_code)
+        response.raise_for_status()
+        _DEBUG_LEVEL_IDS[debug_level_key] = debug_level_id
+        return f"Successfully updated debug log expiration for user '{username}'.\n\n**Log Level:** {log_level}\n**New Expiration:** {new_expiration.strftime('%Y-%m-%d %H:%M:%S')}\n**Trace Flag ID:** {trace_flag['Id']}\n"
+
+    response.raise_for_status()
+    _DEBUG_LEVEL_IDS[debug_level_key] = debug_level_id
+    trace_flag_result = json_loads(response.content)
+    trace_flag_id = trace_flag_result["id"]
+    logger.info("Created new TraceFlag with ID: %s", trace_flag_id)
 
-            return f"""Successfully {operation_status} debug logs for user '{username}'.
+    return f"""Successfully enabled debug logs for user '{username}'.
 
 **Log Level:** {log_level}
 **Expiration:** {expiration_date.strftime('%Y-%m-%d %H:%M:%S')} ({expiration_time} minutes from now)
-**Trace Flag ID:** {trace_flag_id if 'trace_flag_id' in locals() else 'N/A'}
+**Trace Flag ID:** {trace_flag_id}
 """
 
-        elif operation == "disable":
-            # Format datetime for SOQL: milliseconds, no quotes, Z
-            now = datetime.datetime.utcnow()
-            current_time_iso = now.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-            soql = f"""
-                SELECT Id FROM TraceFlag 
-                WHERE TracedEntityId = '{user["Id"]}' 
-                AND ExpirationDate > {current_time_iso}
-            """
-
-            # Execute trace flag query using tooling API
-            params = {"q": soql}
-            logger.info(f"Querying for active TraceFlags for user: {username}")
-            response = sf.session.get(
-                f"{instance_url}/services/data/v63.0/tooling/query/",
-                headers=headers,
-                params=params,
+
+def _disable(sf: "Salesforce", user: Dict[str, Any], username: str, **_: Any) -> str:
+    """Disable debug logs for a user by removing or expiring their trace flags."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    current_time_iso = _soql_datetime(now)
+
+    # Execute trace flag query using tooling API
+    logger.info("Querying for active TraceFlags for user: %s", username)
+    trace_flags = _query(
+        sf,
+        _ACTIVE_TRACE_FLAGS_SOQL % (soql_quote(user["Id"]), current_time_iso),
+        tooling=True,
+    )
+
+    if not trace_flags.get("records") or len(trace_flags["records"]) == 0:
+        return f"No active debug logs found for user '{username}'."
+
+    # First attempt: DELETE trace flags (preferred method), all in one
+    # composite batch; flags that could not be deleted are expired instead
+    trace_flag_ids = [tf["Id"] for tf in trace_flags["records"]]
+    remaining_ids = trace_flag_ids
+    logger.info("Attempting to delete %s TraceFlags", len(trace_flag_ids))
+    try:
+        results = _batch(
+            sf,
+            [
+                {
+                    "method": "DELETE",
+                    "url": f"{_API_VERSION}/tooling/sobjects/TraceFlag/{trace_flag_id}",
+                }
+                for trace_flag_id in trace_flag_ids
+            ],
+            tooling=True,
+        )
+        failed = [
+            (trace_flag_id, result)
+            for trace_flag_id, result in zip(trace_flag_ids, results)
+            if result["statusCode"] >= 300
+        ]
+        # Only the flags that are still there need expiring
+        remaining_ids = [trace_flag_id for trace_flag_id, _ in failed]
+        if not failed:
+            logger.info("Successfully deleted TraceFlags: %s", trace_flag_ids)
+            return f"Successfully disabled {len(trace_flag_ids)} debug log configuration(s) for user '{username}' by removing them."
+
+        from simple_salesforce.exceptions import SalesforceError
+
+        trace_flag_id, result = failed[0]
+        raise SalesforceError(
+            f"{_API_VERSION}/tooling/sobjects/TraceFlag/{trace_flag_id}",
+            result["statusCode"],
+            "TraceFlag",
+            result["result"],
+        )
+    except Exception as delete_error:
+        logger.error("Error deleting trace flags: %s", delete_error)
+
+        # Fallback: Set expiration date to immediate future (5 minutes)
+        try:
+            logger.info("Delete failed, attempting to update expiration date instead")
+            # Set expiration date to 5 minutes in the future
+            near_future_expiration = now + datetime.timedelta(minutes=5)
+            update_data = {"ExpirationDate": _soql_datetime(near_future_expiration)}
+
+            results = _batch(
+                sf,
+                [
+                    {
+                        "method": "PATCH",
+                        "url": f"{_API_VERSION}/tooling/sobjects/TraceFlag/{trace_flag_id}",
+                        "richInput": update_data,
+                    }
+                    for trace_flag_id in remaining_ids
+                ],
+                tooling=True,
+            )
+            if any(result["statusCode"] >= 300 for result in results):
+                raise delete_error
+            logger.info("Updated expiration date for TraceFlags: %s", remaining_ids)
+
+            deleted_count = len(trace_flag_ids) - len(remaining_ids)
+            if deleted_count:
+                return f"Successfully disabled {len(trace_flag_ids)} debug log configuration(s) for user '{username}': removed {deleted_count}, set {len(remaining_ids)} to expire in 5 minutes."
+            return f"Successfully disabled {len(remaining_ids)} debug log configuration(s) for user '{username}'. They will expire in 5 minutes."
+        except Exception as update_error:
+            logger.error("Error updating trace flags: %s", update_error)
+            return format_error(delete_error, "disabling debug logs")
+
+
+def _retrieve(
+    sf: "Salesforce",
+    user: Dict[str, Any],
+    username: str,
+    limit: Optional[int],
+    log_id: Optional[str],
+    include_body: Optional[bool],
+    **_: Any,
+) -> str:
+    """List a user's debug logs, or show one log with or without its body."""
+    sobjects_url = f"https://{sf.sf_instance}{_TOOLING_SOBJECTS_PATH}"
+    headers = sf.headers
+
+    # Set default limit if not provided
+    limit = limit or 10
+
+    # If a specific log ID is provided, retrieve that log directly
+    if log_id:
+        try:
+            logger.info("Retrieving specific log with ID: %s", log_id)
+            # Check if the log exists
+            # Execute log query using tooling API
+            log_query = _query(
+                sf, _APEX_LOG_BY_ID_SOQL % soql_quote(log_id), tooling=True
             )
-            response.raise_for_status()
-            trace_flags = response.json()
-
-            if not trace_flags.get("records") or len(trace_flags["records"]) == 0:
-                return f"No active debug logs found for user '{username}'."
-
-            try:
-                # First attempt: DELETE trace flags (preferred method)
-                trace_flag_ids = [tf["Id"] for tf in trace_flags["records"]]
-                delete_count = 0
-                logger.info(f"Attempting to delete {len(trace_flag_ids)} TraceFlags")
-
-                for trace_flag_id in trace_flag_ids:
-                    response = sf.session.delete(
-                        f"{instance_url}/services/data/v63.0/tooling/sobjects/TraceFlag/{trace_flag_id}",
-                        headers=headers,
-                    )
-                    response.raise_for_status()
-                    delete_count += 1
-                    logger.info(f"Successfully deleted TraceFlag: {trace_flag_id}")
-
-                return f"Successfully disabled {delete_count} debug log configuration(s) for user '{username}' by removing them."
-            except Exception as delete_error:
-                logger.error(f"Error deleting trace flags: {str(delete_error)}")
-
-                # Fallback: Set expiration date to immediate future (5 minutes)
+
+            if not log_query.get("records") or len(log_query["records"]) == 0:
+                return f"No log found with ID '{log_id}'."
+
+            log = log_query["records"][0]
+
+            # If include_body is true, retrieve the full log content
+            if include_body:
                 try:
-                    logger.info(
-                        "Delete failed, attempting to update expiration date instead"
-                    )
-                    # Set expiration date to 5 minutes in the future
-                    near_future_expiration = (
-                        datetime.datetime.now() + datetime.timedelta(minutes=5)
-                    )
-
-                    trace_flag_ids = [tf["Id"] for tf in trace_flags["records"]]
-                    update_count = 0
-
-                    for trace_flag_id in trace_flag_ids:
-                        update_data = {
-                            "ExpirationDate": near_future_expiration.isoformat()
-                        }
-
-                        response = sf.session.patch(
-                            f"{instance_url}/services/data/v63.0/tooling/sobjects/TraceFlag/{trace_flag_id}",
+                    logger.info("Retrieving full log body for log ID: %s", log_id)
+                    log_path = _saved_log_path(log["Id"])
+                    log_body = _read_saved_log(log_path) if log_path else None
+                    if log_body is None:
+                        # Stream the log body, so a large log is spilled to
+                        # a file instead of being held in memory
+                        with sf.session.get(
+                            f"{sobjects_url}/ApexLog/{log['Id']}/Body",
                             headers=headers,
-                            json=update_data,
-                        )
-                        response.raise_for_status()
-                        update_count += 1
-                        logger.info(
-                            f"Updated expiration date for TraceFlag: {trace_flag_id}"
-                        )
-
-                    return f"Successfully disabled {update_count} debug log configuration(s) for user '{username}'. They will expire in 5 minutes."
-                except Exception as update_error:
-                    logger.error(f"Error updating trace flags: {str(update_error)}")
-                    return f"Error disabling debug logs: {str(delete_error)}"
-
-        elif operation == "retrieve":
-            # Set default limit if not provided
-            limit = limit or 10
-
-            # If a specific log ID is provided, retrieve that log directly
-            if log_id:
-                try:
-                    logger.info(f"Retrieving specific log with ID: {log_id}")
-                    # Check if the log exists
-                    soql = f"""
-                        SELECT Id, LogUserId, Operation, Application, Status, LogLength, LastModifiedDate, Request
-                        FROM ApexLog 
-                        WHERE Id = '{log_id}'
-                    """
-
-                    # Execute log query using tooling API
-                    params = {"q": soql}
-                    response = sf.session.get(
-                        f"{instance_url}/services/data/v63.0/tooling/query/",
-                        headers=headers,
-                        params=params,
-                    )
-                    response.raise_for_status()
-                    log_query = response.json()
-
-                    if not log_query.get("records") or len(log_query["records"]) == 0:
-                        return f"No log found with ID '{log_id}'."
-
-                    log = log_query["records"][0]
-
-                    # If include_body is true, retrieve the full log content
-                    if include_body:
-                        try:
-                            logger.info(
-                                f"Retrieving full log body for log ID: {log_id}"
-                            )
-                            # Retrieve the log body
-                            response = sf.session.get(
-                                f"{instance_url}/services/data/v63.0/tooling/sobjects/ApexLog/{log['Id']}/Body",
-                                headers=headers,
-                            )
+                            stream=True,
+                        ) as response:
                             response.raise_for_status()
-                            log_body = response.text
+                            log_body, saved = _read_log_body(response, log_path)
+                    else:
+                        saved = True
+                    if saved:
+                        log_body += f"\n... (truncated; full log saved to {log_path})"
 
-                            last_modified_date = datetime.datetime.fromisoformat(
-                                log["LastModifiedDate"].replace("Z", "+00:00")
-                            )
+                    last_modified_date = _display_datetime(log["LastModifiedDate"])
 
-                            response_text = f"""**Log Details:**
+                    response_text = f"""**Log Details:**
 
 - **ID:** {log['Id']}
 - **Operation:** {log.get('Operation', 'N/A')}
 - **Application:** {log.get('Application', 'N/A')}
 - **Status:** {log.get('Status', 'N/A')}
 - **Size:** {log.get('LogLength', 'N/A')} bytes
-- **Date:** {last_modified_date.strftime('%Y-%m-%d %H:%M:%S')}
+- **Date:** {last_modified_date}
 
 **Log Body:**
 ```
 {log_body}
 ```
 """
-                            return response_text
-                        except Exception as log_error:
-                            logger.error(f"Error retrieving log body: {str(log_error)}")
-                            return f"Error retrieving log body: {str(log_error)}"
-                    else:
-                        # Just return the log metadata
-                        last_modified_date = datetime.datetime.fromisoformat(
-                            log["LastModifiedDate"].replace("Z", "+00:00")
-                        )
+                    return response_text
+                except Exception as log_error:
+                    logger.error("Error retrieving log body: %s", log_error)
+                    return format_error(log_error, "retrieving log body")
+            else:
+                # Just return the log metadata
+                last_modified_date = _display_datetime(log["LastModifiedDate"])
 
-                        response_text = f"""**Log Details:**
+                response_text = f"""**Log Details:**
 
 - **ID:** {log['Id']}
 - **Operation:** {log.get('Operation', 'N/A')}
 - **Application:** {log.get('Application', 'N/A')}
 - **Status:** {log.get('Status', 'N/A')}
 - **Size:** {log.get('LogLength', 'N/A')} bytes
-- **Date:** {last_modified_date.strftime('%Y-%m-%d %H:%M:%S')}
+- **Date:** {last_modified_date}
 
 To view the full log content, add "include_body": true to your request.
 """
-                        return response_text
-                except Exception as error:
-                    logger.error(f"Error retrieving log: {str(error)}")
-                    return f"Error retrieving log: {str(error)}"
-
-            # Query for all logs for the user
-            logger.info(f"Retrieving up to {limit} logs for user: {username}")
-            soql = f"""
-                SELECT Id, LogUserId, Operation, Application, Status, LogLength, LastModifiedDate, Request
-                FROM ApexLog 
-                WHERE LogUserId = '{user["Id"]}'
-                ORDER BY LastModifiedDate DESC 
-                LIMIT {limit}
-            """
-
-            # Execute logs query using tooling API
-            params = {"q": soql}
-            response = sf.session.get(
-                f"{instance_url}/services/data/v63.0/tooling/query/",
-                headers=headers,
-                params=params,
-            )
-            response.raise_for_status()
-            logs = response.json()
-
-            if not logs.get("records") or len(logs["records"]) == 0:
-                return f"No debug logs found for user '{username}'."
-
-            # Format log information
-            response_text = (
-                f"Found {len(logs['records'])} debug logs for user '{username}':\n\n"
-            )
-
-            for i, log in enumerate(logs["records"]):
-                last_modified_date = datetime.datetime.fromisoformat(
-                    log["LastModifiedDate"].replace("Z", "+00:00")
-                )
-
-                response_text += f"""**Log {i + 1}**
+                return response_text
+        except Exception as error:
+            logger.error("Error retrieving log: %s", error)
+            return format_error(error, "retrieving log")
+
+    # Query for all logs for the user
+    logger.info("Retrieving up to %s logs for user: %s", limit, username)
+    # Execute logs query using tooling API
+    logs = _query(
+        sf,
+        _APEX_LOGS_BY_USER_SOQL % (soql_quote(user["Id"]), int(limit)),
+        tooling=True,
+    )
+
+    if not logs.get("records") or len(logs["records"]) == 0:
+        return f"No debug logs found for user '{username}'."
+
+    # Format log information
+    response_text = (
+        f"Found {len(logs['records'])} debug logs for user '{username}':\n\n"
+    )
+
+    for i, log in enumerate(logs["records"]):
+        last_modified_date = _display_datetime(log["LastModifiedDate"])
+
+        response_text += f"""**Log {i + 1}**
 - **ID:** {log['Id']}
 - **Operation:** {log.get('Operation', 'N/A')}
 - **Application:** {log.get('Application', 'N/A')}
 - **Status:** {log.get('Status', 'N/A')}
 - **Size:** {log.get('LogLength', 'N/A')} bytes
-- **Date:** {last_modified_date.strftime('%Y-%m-%d %H:%M:%S')}
+- **Date:** {last_modified_date}
 
 """
 
-            # Add a note about viewing specific logs with full content
-            response_text += """To view a specific log with full content, use:
+    # Add a note about viewing specific logs with full content
+    response_text += """To view a specific log with full content, use:
 ```json
 {
   "operation": "retrieve",
@@ -510,13 +613,211 @@ To view the full log content, add "include_body": true to your request.
 }
 ```
 """
-            return response_text
+    return response_text
+
+
+# Debug log operations by name
+_OPERATIONS = {"enable": _enable, "disable": _disable, "retrieve": _retrieve}
+
+
+def _query(sf: "Salesforce", soql: str, tooling: bool = False) -> Dict[str, Any]:
+    """Run a SOQL query against the REST or Tooling API and return the response."""
+    api = "tooling/query/" if tooling else "query/"
+    response = sf.session.get(
+        f"https://{sf.sf_instance}{_API_PATH}/{api}",
+        headers=sf.headers,
+        params={"q": soql},
+    )
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+def _batch_query(sf: "Salesforce", soqls: List[str]) -> List[List[Dict[str, Any]]]:
+    """Run SOQL queries as one composite batch and return each query's records."""
+    results = _batch(
+        sf,
+        [
+            {"method": "GET", "url": f"{_API_VERSION}/query?{urlencode({'q': soql})}"}
+            for soql in soqls
+        ],
+    )
+    for result in results:
+        if result["statusCode"] >= 300:
+            from simple_salesforce.exceptions import SalesforceError
+
+            raise SalesforceError(
+                f"{_API_VERSION}/query", result["statusCode"], "query", result["result"]
+            )
+    return [result["result"].get("records") or [] for result in results]
 
-        else:
-            # Invalid operation provided
-            valid_operations = ["enable", "disable", "retrieve"]
-            return f"Invalid operation: '{operation}'. Must be one of: {', '.join(valid_operations)}"
 
-    except Exception as e:
-        logger.error(f"Error managing debug logs: {str(e)}")
-        return f"Error managing debug logs: {str(e)}"
+def _is_traced_conflict(response: "requests.Response") -> bool:
+    """Return whether a TraceFlag create failed because the user is already traced."""
+    if response.status_code != 400:
+        return False
+    try:
+        errors = json_loads(response.content)
+    except ValueError:
+        return False
+    return isinstance(errors, list) and any(
+        isinstance(error, dict)
+        and (
+            error.get("errorCode") == _TRACED_ERROR_CODE
+            or _TRACED_MESSAGE.search(str(error.get("message", ""))) is not None
+        )
+        for error in errors
+    )
+
+
+def _display_datetime(value: str) -> str:
+    """
+    Format a Salesforce datetime (e.g., 2025-01-02T03:04:05.000+0000) for display.
+
+    Salesforce returns a fixed layout, so the date and time are sliced out
+    rather than parsed; anything else falls back to fromisoformat.
+    """
+    if len(value) >= 19 and value[10] == "T":
+        return f"{value[:10]} {value[11:19]}"
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+
+
+def _soql_datetime(value: datetime.datetime) -> str:
+    """Format an aware datetime as a SOQL/API UTC timestamp with milliseconds."""
+    return (
+        value.astimezone(datetime.timezone.utc)
+        .isoformat(timespec="milliseconds")
+        .replace("+00:00", "Z")
+    )
+
+
+def _read_log_body(
+    response: "requests.Response", path: Optional[str]
+) -> Tuple[str, bool]:
+    """
+    Read a streamed ApexLog body.
+
+    Returns the body and False, or, for bodies over _MAX_INLINE_LOG_BODY bytes,
+    the first _MAX_INLINE_LOG_BODY bytes and whether the whole log could be
+    saved to path (None if it must not be saved).
+    """
+    body = bytearray()
+    log_file = None
+    tmp_path = None
+    truncated = False
+    try:
+        for chunk in response.iter_content(chunk_size=_LOG_CHUNK_SIZE):
+            if log_file is not None:
+                log_file.write(chunk)
+                continue
+            body += chunk
+            if len(body) > _MAX_INLINE_LOG_BODY:
+                truncated = True
+                if path is None:
+                    break
+                try:
+                    # mkstemp creates an unpredictable name with mode 0600
+                    fd, tmp_path = tempfile.mkstemp(dir=_LOG_DIR, suffix=".tmp")
+                    log_file = os.fdopen(fd, "wb")
+                except OSError as e:
+                    logger.warning("Could not save log body to %s: %s", path, e)
+                    break
+                log_file.write(body)
+                del body[_MAX_INLINE_LOG_BODY:]
+    except BaseException:
+        if log_file is not None:
+            log_file.close()
+            os.remove(tmp_path)
+        raise
+
+    del body[_MAX_INLINE_LOG_BODY:]
+    saved = False
+    if log_file is not None:
+        log_file.close()
+        try:
+            os.replace(tmp_path, path)
+            saved = True
+        except OSError as e:
+            logger.warning("Could not save log body to %s: %s", path, e)
+            os.remove(tmp_path)
+        _prune_saved_logs()
+    if truncated and not saved:
+        body += b"\n... (truncated)"
+    return body.decode("utf-8", errors="replace"), saved
+
+
+def _saved_log_path(log_id: str) -> Optional[str]:
+    """
+    Return the file a log's body is saved to, or None if it can't be saved.
+
+    The directory is created private to the current user; an existing one
+    that another user owns, or that others can access, is not used.
+    """
+    if not _LOG_DIR or not _LOG_ID.fullmatch(log_id):
+        return None
+    try:
+        os.makedirs(_LOG_DIR, mode=0o700, exist_ok=True)
+        info = os.stat(_LOG_DIR, follow_symlinks=False)
+    except OSError as e:
+        logger.warning("Could not create log directory %s: %s", _LOG_DIR, e)
+        return None
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        logger.warning("Not saving log bodies to %s: not a private directory", _LOG_DIR)
+        return None
+    return os.path.join(_LOG_DIR, f"{log_id}.log")
+
+
+def _read_saved_log(path: str) -> Optional[str]:
+    """Return the inline part of a previously saved log body, or None if not saved."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    with os.fdopen(fd, "rb") as f:
+        # Only a regular file this user wrote is trusted as the log's body
+        info = os.fstat(f.fileno())
+        if not stat.S_ISREG(info.st_mode) or info.st_uid != os.getuid():
+            logger.warning("Ignoring saved log body %s: not owned by this user", path)
+            return None
+        body = f.read(_MAX_INLINE_LOG_BODY)
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    logger.debug("Using saved log body %s", path)
+    return body.decode("utf-8", errors="replace")
+
+
+def _prune_saved_logs() -> None:
+    """Remove all but the _MAX_SAVED_LOGS most recently used saved log bodies."""
+    try:
+        paths = [
+            entry.path for entry in os.scandir(_LOG_DIR) if entry.name.endswith(".log")
+        ]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[_MAX_SAVED_LOGS:]:
+            os.remove(path)
+    except OSError as e:
+        logger.warning("Could not prune saved log bodies: %s", e)
+
+
+def _batch(
+    sf: "Salesforce", subrequests: List[Dict[str, Any]], tooling: bool = False
+) -> List[Dict[str, Any]]:
+    """Send subrequests as composite batches of up to 25 and return their results."""
+    api = "tooling/composite/batch" if tooling else "composite/batch"
+    results = []
+    for i in range(0, len(subrequests), _BATCH_SIZE):
+        response = sf.session.post(
+            f"https://{sf.sf_instance}{_API_PATH}/{api}",
+            headers=sf.headers,
+            json={"batchRequests": subrequests[i : i + _BATCH_SIZE]},
+        )
+        response.raise_for_status()
+        results.extend(json_loads(response.content)["results"])
+    return results
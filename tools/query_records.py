@@ -13,9 +13,12 @@ The query builder handles:
 - Relationship field traversal (e.g., Account.Name)
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+import functools
 import logging
-from sf_connection import get_connection
+from sf_connection import get_connection, format_error, validate_api_name
+from ._describe_cache import get_derived, peek_describe
+from ._markdown import escape_cell
 
 # Configure logging
 logger = logging.getLogger("sf_mcp_server.query_records")
@@ -65,72 +68,82 @@ def query_records(
             limit=10
         )
     """
-    logger.info(f"Querying {object_name} records with fields: {fields}")
+    logger.info("Querying %s records with fields: %s", object_name, fields)
     sf = get_connection()
 
     try:
+        error = validate_api_name(object_name)
+        if error:
+            return error
+
+        # Drop blank and duplicate fields (SOQL rejects duplicates)
+        unique_fields = {}
+        for field in fields:
+            field = field.strip()
+            if field:
+                unique_fields.setdefault(field.lower(), field)
+        fields = list(unique_fields.values())
+        if not fields:
+            return "Error: At least one field must be specified"
+
+        # Reject unknown fields up front when the object's describe is cached,
+        # saving a round trip for a query that would fail
+        if peek_describe(object_name) is not None:
+            field_names = get_derived(object_name, "field_names", _field_names)
+            unknown = [
+                f for f in fields if f.isidentifier() and f.lower() not in field_names
+            ]
+            if unknown:
+                logger.info("Unknown fields on %s: %s", object_name, unknown)
+                return f"Error: Unknown field(s) on {object_name}: {', '.join(unknown)}"
+
         # Validate and sanitize limit
         if limit is None:
             limit = 10
         elif limit < 1:
-            logger.warning(f"Invalid limit {limit}, using minimum of 1")
+            logger.warning("Invalid limit %s, using minimum of 1", limit)
             limit = 1
         elif limit > 2000:
-            logger.warning(f"Limit {limit} exceeds maximum, capping at 2000")
+            logger.warning("Limit %s exceeds maximum, capping at 2000", limit)
             limit = 2000
 
-        # Build SOQL query
-        field_list = ", ".join(fields)
-        query = f"SELECT {field_list} FROM {object_name}"
-
-        if where_clause:
-            logger.debug(f"Adding WHERE clause: {where_clause}")
-            query += f" WHERE {where_clause}"
-
-        if order_by:
-            logger.debug(f"Adding ORDER BY clause: {order_by}")
-            query += f" ORDER BY {order_by}"
-
-        query += f" LIMIT {limit}"
-        logger.info(f"Executing SOQL query: {query}")
+        # Build SOQL query; identical query shapes reuse the cached text
+        query = _build_soql(object_name, tuple(fields), where_clause, order_by, limit)
+        logger.info("Executing SOQL query: %s", query)
 
-        # Execute query
+        # Execute query, following nextRecordsUrl when Salesforce returns the
+        # results in more than one batch
         results = sf.query(query)
-        logger.debug(f"Query returned {results.get('totalSize', 0)} records")
+        logger.debug("Query returned %s records", results.get("totalSize", 0))
+        total_records = results.get("totalSize", 0)
+        records = results.get("records", [])
+        while not results.get("done", True) and len(records) < limit:
+            results = sf.query_more(results["nextRecordsUrl"], identifier_is_url=True)
+            records.extend(results.get("records", []))
+        records = records[:limit]
 
         # Format results
-        if not results.get("records"):
-            logger.info(f"No records found for query: {query}")
+        if not records:
+            logger.info("No records found for query: %s", query)
             return f"No records found for query: {query}"
 
-        total_records = results.get("totalSize", 0)
-        displayed_records = len(results.get("records", []))
+        displayed_records = len(records)
 
         # Start with query information
-        result = f"Query: {query}\n\n"
-        result += f"Found {total_records} records. Displaying {displayed_records}.\n\n"
-
-        # Create table header
-        result += "| " + " | ".join(fields) + " |\n"
-        result += "|" + "|".join(["-" * (len(f) + 2) for f in fields]) + "|\n"
-
-        # Add table rows
-        for record in results.get("records", []):
+        lines = [
+            f"Query: {query}\n\n",
+            f"Found {total_records} records. Displaying {displayed_records}.\n\n",
+            # Create table header
+            "| " + " | ".join(fields) + " |\n",
+            "|" + "|".join(["-" * (len(f) + 2) for f in fields]) + "|\n",
+        ]
+
+        # Add table rows, reading each field through an accessor built once
+        accessors = [_field_accessor(field) for field in fields]
+        for record in records:
             row = []
-            for field in fields:
-                # Handle relationship fields (e.g., Account.Name)
-                if "." in field:
-                    parts = field.split(".")
-                    value = record
-                    for part in parts:
-                        if isinstance(value, dict):
-                            value = value.get(part, "")
-                        else:
-                            value = ""
-                            break
-                else:
-                    # Handle direct fields
-                    value = record.get(field, "")
+            for accessor in accessors:
+                value = accessor(record)
 
                 # Format value for table cell
                 if value is None:
@@ -141,14 +154,64 @@ def query_records(
                     formatted_value = str(value)
                 else:
                     # Escape pipe characters and remove newlines to maintain table format
-                    formatted_value = str(value).replace("\n", " ").replace("|", "\\|")
+                    formatted_value = escape_cell(value)
 
                 row.append(formatted_value)
 
-            result += "| " + " | ".join(row) + " |\n"
+            lines.append("| " + " | ".join(row) + " |\n")
 
-        return result
+        return "".join(lines)
 
     except Exception as e:
-        logger.error(f"Error querying {object_name} records: {str(e)}")
-        return f"Error querying {object_name} records: {str(e)}"
+        logger.error("Error querying %s records: %s", object_name, e)
+        return format_error(e, f"querying {object_name} records")
+
+
+@functools.lru_cache(maxsize=512)
+def _build_soql(
+    object_name: str,
+    fields: Tuple[str, ...],
+    where_clause: Optional[str],
+    order_by: Optional[str],
+    limit: int,
+) -> str:
+    """Build the SOQL text for a query_records call."""
+    query = f"SELECT {', '.join(fields)} FROM {object_name}"
+
+    if where_clause:
+        logger.debug("Adding WHERE clause: %s", where_clause)
+        query += f" WHERE {where_clause}"
+
+    if order_by:
+        logger.debug("Adding ORDER BY clause: %s", order_by)
+        query += f" ORDER BY {order_by}"
+
+    return query + f" LIMIT {limit}"
+
+
+def _field_names(describe: Dict[str, Any]) -> FrozenSet[str]:
+    """Return the lowercase API names of an object's fields."""
+    return frozenset(f["name"].lower() for f in describe["fields"])
+
+
+def _field_accessor(field: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Return a function that reads a field from a query result record.
+
+    Relationship fields (e.g., Account.Name) are followed through the nested
+    records; a missing field or a null relationship reads as "".
+    """
+    if "." not in field:
+        return lambda record: record.get(field, "")
+
+    path = tuple(field.split("."))
+
+    def get(record: Dict[str, Any]) -> Any:
+        value = record
+        for part in path:
+            if not isinstance(value, dict):
+                return ""
+            value = value.get(part, "")
+        return value
+
+    return get
@@ -9,13 +9,41 @@ Functions:
 - search_objects: Search for Salesforce objects by name or label pattern
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Tuple
+import functools
 import logging
-from sf_connection import get_connection
+import re
+import threading
+from sf_connection import get_sobject_index, format_error
+from .describe_objects_batch import fetch_describes_batch
 
 # Configure logging
 logger = logging.getLogger("sf_mcp_server.search_objects")
 
+# Table row template, %-formatted for each matching object
+_OBJECT_ROW = "| %s | %s | %s |\n"
+
+# Field lists are only included for this many matches, so a broad pattern
+# does not describe hundreds of objects
+_MAX_FIELD_LISTS = 20
+
+# Matches of recent searches, keyed by their sorted terms; emptied when the
+# sObject index is rebuilt from a newer global describe. Tools run in worker
+# threads, so it is only read and updated while holding _MATCH_CACHE_LOCK.
+_MATCH_CACHE_SIZE = 256
+_RECENT_SEARCHES = 8
+_MATCH_CACHE: Dict[str, Any] = {"index": None, "matches": {}}
+_MATCH_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a normalized (lowercase, single-space separated) search pattern
+    into a regex that matches ANY of its terms.
+    """
+    return re.compile("|".join(re.escape(term) for term in pattern.split()))
+
 
 def search_objects(pattern: str, include_fields: bool = False) -> str:
     """
@@ -31,7 +59,8 @@ def search_objects(pattern: str, include_fields: bool = False) -> str:
     Args:
         pattern: Search pattern for object names (e.g., "account", "contact", "custom")
                  Can include multiple space-separated terms
-        include_fields: Whether to include fields in the response (default: False)
+        include_fields: Whether to include the field API names of the first
+                        20 matching objects (default: False)
 
     Returns:
         Formatted markdown table with matching objects showing:
@@ -48,54 +77,131 @@ def search_objects(pattern: str, include_fields: bool = False) -> str:
 
         # Search for objects related to orders or products
         search_objects("order product")
-    """
-    logger.info(f"Searching for Salesforce objects matching pattern: '{pattern}'")
 
-    # Get connection to Salesforce
-    sf = get_connection()
+        # Search for Case objects and list their fields
+        search_objects("case", include_fields=True)
+    """
+    logger.info("Searching for Salesforce objects matching pattern: '%s'", pattern)
 
-    # Get global describe (list of all objects)
+    # Get the search index over the global describe, cached between searches
     try:
-        describe_global = sf.describe()
-        logger.debug(
-            f"Retrieved {len(describe_global['sobjects'])} objects from global describe"
-        )
+        sobject_index = get_sobject_index()
+        logger.debug("Retrieved %s objects from global describe", len(sobject_index))
     except Exception as e:
-        logger.error(f"Error retrieving global describe: {str(e)}")
-        return f"Error retrieving Salesforce objects: {str(e)}"
+        logger.error("Error retrieving global describe: %s", e)
+        return format_error(e, "retrieving Salesforce objects")
 
     # Split the search pattern into individual terms for more flexible matching
     search_terms = pattern.lower().split()
-    logger.debug(f"Using search terms: {search_terms}")
+    logger.debug("Using search terms: %s", search_terms)
 
     # Filter objects based on search terms (match ANY term)
-    matching_objects = [
-        obj
-        for obj in describe_global["sobjects"]
-        if any(
-            term in obj["name"].lower() or term in obj["label"].lower()
-            for term in search_terms
-        )
-    ]
+    matching_objects = [obj for _, _, obj in _find_matches(search_terms, sobject_index)]
 
     # Handle case where no objects match
-    if not matching_objects:
-        logger.info(f"No objects found matching pattern: '{pattern}'")
+    match_count = len(matching_objects)
+    if not match_count:
+        logger.info("No objects found matching pattern: '%s'", pattern)
         return f"No Salesforce objects found matching '{pattern}'."
 
     # Format results as a markdown table
-    logger.info(f"Found {len(matching_objects)} objects matching pattern: '{pattern}'")
-    result = (
-        f"Found {len(matching_objects)} Salesforce objects matching '{pattern}':\n\n"
-    )
-    result += "| API Name | Label | Custom Object |\n"
-    result += "|----------|-------|---------------|\n"
+    logger.info("Found %s objects matching pattern: '%s'", match_count, pattern)
+    parts = [
+        f"Found {match_count} Salesforce objects matching '{pattern}':\n\n"
+        "| API Name | Label | Custom Object |\n"
+        "|----------|-------|---------------|\n"
+    ]
 
     # Add each matching object to the table
-    for obj in matching_objects:
-        is_custom = "Yes" if obj.get("custom", False) else "No"
-        result += (
-            f"| {obj.get('name', 'N/A')} | {obj.get('label', 'N/A')} | {is_custom} |\n"
+    parts.extend(
+        [
+            _OBJECT_ROW % (obj.name, obj.label, "Yes" if obj.custom else "No")
+            for obj in matching_objects
+        ]
+    )
+
+    if include_fields:
+        parts.extend(_iter_field_lists([obj.name for obj in matching_objects]))
+
+    return "".join(parts)
+
+
+def _find_matches(search_terms: List[str], sobject_index: List[Tuple]) -> Tuple:
+    """
+    Return the index entries matching ANY of the search terms.
+
+    Matching does not depend on the order of the terms, so searches that only
+    reorder them share a cache entry. When every term contains a term of a
+    recent search (e.g., "acco" after "acc"), only that search's matches are
+    scanned, since they include every entry the new terms can match.
+    """
+    key = " ".join(sorted(set(search_terms)))
+    candidates = sobject_index
+    with _MATCH_CACHE_LOCK:
+        if _MATCH_CACHE["index"] is not sobject_index:
+            _MATCH_CACHE["index"] = sobject_index
+            _MATCH_CACHE["matches"] = {}
+        cache = _MATCH_CACHE["matches"]
+
+        matches = cache.get(key)
+        if matches is not None:
+            logger.debug("Using cached matches for terms: %s", key)
+            return matches
+
+        for recent_key in reversed(list(cache)[-_RECENT_SEARCHES:]):
+            recent_terms = recent_key.split()
+            if all(any(r in term for r in recent_terms) for term in search_terms):
+                logger.debug("Narrowing the matches for terms: %s", recent_key)
+                candidates = cache[recent_key]
+                break
+
+    if len(search_terms) == 1:
+        # A plain substring test is faster than a regex for a single term
+        term = search_terms[0]
+        matches = tuple(
+            entry for entry in candidates if term in entry[0] or term in entry[1]
         )
+    elif search_terms:
+        regex = _compile_pattern(key)
+        matches = tuple(
+            entry
+            for entry in candidates
+            if regex.search(entry[0]) or regex.search(entry[1])
+        )
+    else:
+        matches = ()
+
+    with _MATCH_CACHE_LOCK:
+        # Skip storing if the index was replaced while matching
+        if _MATCH_CACHE["index"] is sobject_index:
+            cache = _MATCH_CACHE["matches"]
+            if key not in cache and len(cache) >= _MATCH_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[key] = matches
+    return matches
 
-    return result
+
+def _iter_field_lists(object_names: List[str]) -> Iterator[str]:
+    """
+    Yield a field list section for the first _MAX_FIELD_LISTS matching objects.
+
+    The describes come from the shared cache or from composite batch
+    requests sent in parallel, rather than one request per object.
+    """
+    listed = object_names[:_MAX_FIELD_LISTS]
+    describes, errors = fetch_describes_batch(listed)
+    yield "\n## Fields\n\n"
+    for name in listed:
+        if name in describes:
+            fields = describes[name]["fields"]
+            field_names = ", ".join([field["name"] for field in fields])
+            yield f"**{name}** ({len(fields)} fields): {field_names}\n\n"
+        else:
+            yield f"**{name}**: Error: {errors.get(name, 'not described')}\n\n"
+
+    omitted = len(object_names) - len(listed)
+    if omitted:
+        yield (
+            f"Fields of the other {omitted} matching objects are not listed; "
+            f"use a more specific pattern to see them.\n"
+        )